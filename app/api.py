@@ -7,102 +7,59 @@ This module defines all the API endpoints including:
 
 Note: This API returns only JSON data, not graphs or visualizations.
 """
-from fastapi import APIRouter, HTTPException, Query, Request
-from pydantic import BaseModel
-from typing import List
-from .data_loader import load_data, load_benchmark_data, DATA_PATH_ec10eq
-from .security import apply_rate_limit
-import sys
-from pathlib import Path
-import pandas as pd
-
-# Add data directory to path for importing data processing functions
-data_dir = Path(__file__).resolve().parent.parent / "data"
-sys.path.insert(0, str(data_dir.parent))
-
-# ============================================================================
-# Data processing function imports
-# ============================================================================
-# These functions are imported from separate modules to keep business logic
-# separate from API routing logic.
-
-# Cache for the EC10eq data function (lazy import with caching)
-_ec10eq_get_data_func = None
-
-
-def _get_ec10eq_data_function():
-    """
-    Import and cache the get_ec10eq_data_json function from api_ec10eq module.
-    
-    This function provides a clean separation between API routing (this file)
-    and data processing logic (api_ec10eq.py module).
-    
-    Returns:
-        Function get_ec10eq_data_json from api_ec10eq module
-        
-    Raises:
-        ImportError: If the module cannot be imported
-    """
-    global _ec10eq_get_data_func
-    
-    if _ec10eq_get_data_func is not None:
-        return _ec10eq_get_data_func
-    
-    # Import using importlib to handle spaces in directory name ("EC10 details")
-    ec10eq_module_path = Path(__file__).resolve().parent.parent / "data" / "graph" / "EC10 details" / "api_ec10eq.py"
-    
-    if not ec10eq_module_path.exists():
-        raise ImportError(f"EC10eq module not found at {ec10eq_module_path}")
-    
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("api_ec10eq", ec10eq_module_path)
-    ec10eq_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(ec10eq_module)
-    
-    _ec10eq_get_data_func = ec10eq_module.get_ec10eq_data_json
-    return _ec10eq_get_data_func
-
-
-# Cache for the SSD comparison data function (lazy import with caching)
-_ssd_comparison_get_data_func = None
+from __future__ import annotations
 
+import os
 
-def _get_ssd_comparison_data_function():
-    """
-    Import and cache the get_ssd_comparison_data function from ssd_comparison_data module.
-    
-    This function provides a clean separation between API routing (this file)
-    and data processing logic (ssd_comparison_data.py module).
-    
-    Returns:
-        Function get_ssd_comparison_data from ssd_comparison_data module
-        
-    Raises:
-        ImportError: If the module cannot be imported
-    """
-    global _ssd_comparison_get_data_func
-    
-    if _ssd_comparison_get_data_func is not None:
-        return _ssd_comparison_get_data_func
-    
-    # Import using importlib to handle spaces in directory name ("SSD comparison")
-    ssd_comparison_module_path = Path(__file__).resolve().parent.parent / "data" / "graph" / "SSD comparison" / "ssd_comparison_data.py"
-    
-    if not ssd_comparison_module_path.exists():
-        raise ImportError(f"SSD comparison module not found at {ssd_comparison_module_path}")
-    
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("ssd_comparison_data", ssd_comparison_module_path)
-    ssd_comparison_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(ssd_comparison_module)
-    
-    _ssd_comparison_get_data_func = ssd_comparison_module.get_ssd_comparison_data
-    return _ssd_comparison_get_data_func
-
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import BaseModel
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from .data_loader import (
+    load_data,
+    load_benchmark_data,
+    load_chemical_names_lower,
+    load_cas_index,
+    load_benchmark_cas_index,
+    canonicalize_cas,
+    DATA_PATH_ec10eq,
+)
+from .security import rate_limit_data, rate_limit_plot
+from .cache import LRUCache, cache_response
+from .responses import ORJSONResponse, StaticJSON
+from . import plotting
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# pandas is only needed for type hints here; data_loader imports it on first load
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Créer le routeur API
 # Toutes les routes définies ici seront préfixées par /api (défini dans main.py)
-router = APIRouter()
+# Responses are serialized with orjson, whatever the application the router is included in
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Columns of the SSD data file read by get_ssd_data (used by the SSD endpoints)
+SSD_DATA_COLUMNS = [
+    "cas_number",
+    "chemical_name",
+    "EC10eq_list",
+    "species_ec10eq_dict_list",
+    "SSD_mu_logEC10eq",
+    "SSD_sigma_logEC10eq",
+    "HC20",
+    "n_species",
+    "n_ecotox_group",
+]
+
+# Maximum number of identifiers whose resolved CAS number is kept in memory
+RESOLVED_CAS_CACHE_SIZE = int(os.getenv("RESOLVED_CAS_CACHE_SIZE", "4096"))
+
+# Identifier without surrounding whitespace -> resolved CAS number (least
+# recently used first). The data files are loaded once per process, so a
+# resolution stays valid for the lifetime of the process.
+_resolved_cas = LRUCache(RESOLVED_CAS_CACHE_SIZE)
 
 
 # ============================================================================
@@ -239,6 +196,8 @@ def load_and_validate_benchmark_data(required_columns: List[str]) -> pd.DataFram
     """
     Load benchmark data and validate required columns.
     
+    Only the required columns are read from the Parquet file.
+    
     Args:
         required_columns: List of required column names
         
@@ -249,7 +208,7 @@ def load_and_validate_benchmark_data(required_columns: List[str]) -> pd.DataFram
         HTTPException: If data cannot be loaded or columns are missing
     """
     try:
-        df = load_benchmark_data()
+        df = load_benchmark_data(tuple(required_columns))
         validate_columns(df, required_columns, "benchmark data")
         return df
     except FileNotFoundError as e:
@@ -261,12 +220,17 @@ def load_and_validate_benchmark_data(required_columns: List[str]) -> pd.DataFram
         raise handle_data_errors(e, "benchmark data")
 
 
-def load_and_validate_ssd_data(required_columns: List[str] = None) -> pd.DataFrame:
+def load_and_validate_ssd_data(required_columns: List[str] = None, columns: List[str] = None) -> pd.DataFrame:
     """
     Load SSD data and optionally validate required columns.
     
+    Only the required columns (or the given columns) are read from the
+    Parquet file.
+    
     Args:
         required_columns: Optional list of required column names
+        columns: Optional list of columns to read without validation
+                 (defaults to required_columns, or all columns)
         
     Returns:
         DataFrame with SSD data
@@ -274,8 +238,9 @@ def load_and_validate_ssd_data(required_columns: List[str] = None) -> pd.DataFra
     Raises:
         HTTPException: If data cannot be loaded or columns are missing
     """
+    columns = columns or required_columns
     try:
-        df = load_data()
+        df = load_data(tuple(columns) if columns else None)
         if required_columns:
             validate_columns(df, required_columns, "SSD data")
         return df
@@ -288,6 +253,46 @@ def load_and_validate_ssd_data(required_columns: List[str] = None) -> pd.DataFra
         raise handle_data_errors(e, "SSD data")
 
 
+def format_substance_matches(dataframe: pd.DataFrame) -> List[dict]:
+    """
+    Build the list of unique substances (CAS number and name) in a DataFrame.
+    
+    Columns are converted to Python lists once and zipped together, instead of
+    boxing every row into a pandas Series with iterrows(). Both columns are
+    string columns in load_data(), so the list items are already str objects.
+    
+    Args:
+        dataframe: DataFrame containing "cas_number" and "chemical_name" columns
+        
+    Returns:
+        List of dictionaries with "cas" and "name" keys
+    """
+    results = dataframe[["cas_number", "chemical_name"]].drop_duplicates()
+    cas_numbers = results["cas_number"].tolist()
+    names = results["chemical_name"].tolist()
+    return [{"cas": cas, "name": name} for cas, name in zip(cas_numbers, names)]
+
+
+def match_chemical_names(query_lower: str, exact: bool = False) -> np.ndarray:
+    """
+    Find the SSD data rows whose lowercased chemical name matches a query.
+    
+    Args:
+        query_lower: Lowercased search term
+        exact: If True, names must equal the query; otherwise they must contain
+               it as a literal substring
+        
+    Returns:
+        Row positions in load_data() of the matching substances
+    """
+    names_lower = load_chemical_names_lower()
+    if exact:
+        mask = pc.equal(names_lower, query_lower)
+    else:
+        mask = pc.match_substring(names_lower, query_lower)
+    return np.flatnonzero(mask.to_numpy(zero_copy_only=False))
+
+
 def get_license_notice() -> dict:
     """
     Get license notice information for API responses.
@@ -420,66 +425,103 @@ def validate_search_query(query: str) -> str:
     return query_clean
 
 
-def resolve_cas_from_identifier(identifier: str, dataframe: pd.DataFrame = None) -> str:
+def get_single_cas_number(matches: pd.DataFrame) -> Optional[str]:
     """
-    Resolve a CAS number or chemical name to a CAS number.
+    Return the CAS number shared by all matching rows, if there is only one.
+    
+    Compares every value to the first one instead of building the array of
+    unique values, which is only needed to report multiple matches.
     
     Args:
-        identifier: CAS number or chemical name (case-insensitive, partial match supported)
-        dataframe: Optional DataFrame to use (if None, loads data)
+        matches: Non-empty DataFrame containing a "cas_number" column
+        
+    Returns:
+        The CAS number as a string, or None if the rows have different CAS numbers
+    """
+    cas_numbers = matches["cas_number"]
+    first_cas = cas_numbers.iloc[0]
+    if (cas_numbers != first_cas).any():
+        return None
+    return first_cas
+
+
+def _resolve_exact_cas(identifier_clean: str, dataframe: pd.DataFrame) -> Optional[str]:
+    """
+    Look up an identifier written as a CAS number of the SSD data.
+    
+    Args:
+        identifier_clean: Identifier without surrounding whitespace
+        dataframe: SSD DataFrame from load_data()
+        
+    Returns:
+        CAS number as stored in the data, or None if the identifier is not an
+        exact CAS number of the data
+    """
+    # Dictionary lookup on the canonical CAS form
+    canonical_cas = canonicalize_cas(identifier_clean)
+    position = load_cas_index().get(canonical_cas) if canonical_cas else None
+    if position is None:
+        return None
+    return dataframe["cas_number"].iat[position]
+
+
+def _cas_from_exact_name(identifier: str, name_exact: pd.DataFrame) -> str:
+    """
+    Return the CAS number of the rows whose name equals an identifier.
+    
+    Args:
+        identifier: Identifier as provided by the client (used in error messages)
+        name_exact: Non-empty DataFrame of the rows matching the name exactly
         
     Returns:
         CAS number as string
         
     Raises:
-        ValueError: If no matching substance is found or multiple matches found
+        ValueError: If the rows have different CAS numbers
+    """
+    single_cas = get_single_cas_number(name_exact)
+    if single_cas is not None:
+        return single_cas
+    raise ValueError(
+        f"Multiple CAS numbers found for name '{identifier}': {list(name_exact['cas_number'].unique())}. "
+        f"Please use a CAS number instead."
+    )
+
+
+def _resolve_partial_match(identifier: str, identifier_clean: str, dataframe: pd.DataFrame) -> str:
     """
-    df = dataframe if dataframe is not None else load_data()
-    identifier_clean = identifier.strip()
-    
-    # Try exact CAS match
-    cas_exact = df[df["cas_number"] == identifier_clean]
-    if not cas_exact.empty:
-        return identifier_clean
-    
-    # Try exact name match (case-insensitive)
-    name_exact = df[df["chemical_name"].str.lower() == identifier_clean.lower()]
-    if not name_exact.empty:
-        cas_numbers = name_exact["cas_number"].unique()
-        if len(cas_numbers) == 1:
-            return str(cas_numbers[0])
-        raise ValueError(
-            f"Multiple CAS numbers found for name '{identifier}': {list(cas_numbers)}. "
-            f"Please use a CAS number instead."
-        )
+    Resolve an identifier by partial name match, then by partial CAS match.
     
-    # Try partial name match (case-insensitive)
-    name_partial = df[df["chemical_name"].str.lower().str.contains(identifier_clean.lower(), na=False)]
+    Args:
+        identifier: Identifier as provided by the client (used in error messages)
+        identifier_clean: Identifier without surrounding whitespace
+        dataframe: SSD DataFrame from load_data()
+        
+    Returns:
+        CAS number as string
+        
+    Raises:
+        ValueError: If no matching substance is found or multiple matches found
+    """
+    # Try partial name match (case-insensitive, literal substring without regex)
+    name_partial = dataframe.iloc[match_chemical_names(identifier_clean.lower())]
     if not name_partial.empty:
-        cas_numbers = name_partial["cas_number"].unique()
-        if len(cas_numbers) == 1:
-            return str(cas_numbers[0])
-        matches = name_partial[["cas_number", "chemical_name"]].drop_duplicates()
-        matches_list = [
-            {"cas": str(row["cas_number"]), "name": str(row["chemical_name"])}
-            for _, row in matches.iterrows()
-        ]
+        single_cas = get_single_cas_number(name_partial)
+        if single_cas is not None:
+            return single_cas
+        matches_list = format_substance_matches(name_partial)
         raise ValueError(
             f"Multiple substances found matching '{identifier}': {matches_list}. "
             f"Please be more specific or use a CAS number."
         )
     
-    # Try partial CAS match
-    cas_partial = df[df["cas_number"].str.contains(identifier_clean, na=False)]
+    # Try partial CAS match (literal substring without regex)
+    cas_partial = dataframe[dataframe["cas_number"].str.contains(identifier_clean, regex=False, na=False)]
     if not cas_partial.empty:
-        cas_numbers = cas_partial["cas_number"].unique()
-        if len(cas_numbers) == 1:
-            return str(cas_numbers[0])
-        matches = cas_partial[["cas_number", "chemical_name"]].drop_duplicates()
-        matches_list = [
-            {"cas": str(row["cas_number"]), "name": str(row["chemical_name"])}
-            for _, row in matches.iterrows()
-        ]
+        single_cas = get_single_cas_number(cas_partial)
+        if single_cas is not None:
+            return single_cas
+        matches_list = format_substance_matches(cas_partial)
         raise ValueError(
             f"Multiple CAS numbers found matching '{identifier}': {matches_list}. "
             f"Please use the full CAS number."
@@ -488,8 +530,73 @@ def resolve_cas_from_identifier(identifier: str, dataframe: pd.DataFrame = None)
     raise ValueError(f"No substance found matching '{identifier}'. Please check the CAS number or name.")
 
 
+def resolve_cas_identifiers(identifiers: List[str], dataframe: pd.DataFrame = None) -> Tuple[List[str], List[str]]:
+    """
+    Resolve several CAS numbers or chemical names to CAS numbers.
+    
+    Each identifier is tried in order as an exact CAS number, an exact name,
+    a partial name and a partial CAS number. The exact name matches of all
+    identifiers are found in a single pass over the chemical names, only
+    identifiers without an exact CAS or name match fall back to the partial
+    matches, and previously resolved identifiers are served from the cache.
+    
+    Args:
+        identifiers: CAS numbers or chemical names (case-insensitive, partial match supported)
+        dataframe: Optional SSD DataFrame from load_data() (if None, loads data)
+        
+    Returns:
+        Tuple of:
+        - CAS numbers of the resolved identifiers, in input order
+        - Error messages ("'identifier': reason") of the identifiers that could not be resolved
+        
+    Example:
+        >>> resolve_cas_identifiers(["50-00-0", "formaldehyde"])
+        (['50-00-0', '50-00-0'], [])
+    """
+    df = dataframe if dataframe is not None else load_data()
+    identifiers_clean = [identifier.strip() for identifier in identifiers]
+    exact_cas = [
+        _resolved_cas.get(identifier_clean) or _resolve_exact_cas(identifier_clean, df)
+        for identifier_clean in identifiers_clean
+    ]
+    
+    # Exact name matches of the remaining identifiers in one pass:
+    # index of the matching name in unique_names for each row, -1 if none
+    unique_names = list(dict.fromkeys(
+        identifier_clean.lower()
+        for identifier_clean, cas in zip(identifiers_clean, exact_cas)
+        if cas is None
+    ))
+    name_rows = {}
+    if unique_names:
+        name_index = pc.index_in(load_chemical_names_lower(), value_set=pa.array(unique_names, type=pa.string()))
+        name_index = pc.fill_null(name_index, -1).to_numpy()
+        matched_rows = np.flatnonzero(name_index >= 0)
+        for i, name in enumerate(unique_names):
+            name_rows[name] = matched_rows[name_index[matched_rows] == i]
+    
+    resolved_cas_list = []
+    invalid_identifiers = []
+    for identifier, identifier_clean, cas in zip(identifiers, identifiers_clean, exact_cas):
+        try:
+            if cas is None:
+                rows = name_rows[identifier_clean.lower()]
+                if len(rows):
+                    cas = _cas_from_exact_name(identifier, df.iloc[rows])
+                else:
+                    cas = _resolve_partial_match(identifier, identifier_clean, df)
+            # Only successful resolutions are stored, so that error messages
+            # are always built from the identifier of the current request
+            _resolved_cas.set(identifier_clean, cas)
+            resolved_cas_list.append(cas)
+        except ValueError as e:
+            invalid_identifiers.append(f"'{identifier}': {str(e)}")
+    return resolved_cas_list, invalid_identifiers
+
+
 @router.get("/summary")
-@apply_rate_limit("60/minute")
+@rate_limit_data()
+@cache_response()
 def get_summary(request: Request):
     """
     Number of chemicals and endpoints available on the platform.
@@ -503,11 +610,13 @@ def get_summary(request: Request):
     try:
         df = load_and_validate_benchmark_data(["cas_number", "Source"])
         
+        # Count every source in a single pass over the categorical codes
+        source_counts = df["Source"].value_counts()
         result = {
             "chemicals": int(df["cas_number"].nunique()),
-            "EF_openchemfacts(calculated)": int((df["Source"] == "OpenChemFacts").sum()),
-            "EF_usetox(official)": int((df["Source"] == "USEtox").sum()),
-            "EF_ef(official)": int((df["Source"] == "EF").sum()),
+            "EF_openchemfacts(calculated)": int(source_counts.get("OpenChemFacts", 0)),
+            "EF_usetox(official)": int(source_counts.get("USEtox", 0)),
+            "EF_ef(official)": int(source_counts.get("EF", 0)),
             "license": get_license_notice(),
         }
         return result
@@ -517,8 +626,34 @@ def get_summary(request: Request):
         raise handle_data_errors(e, "summary data")
 
 
+# Static response of /metadata, serialized once at import
+METADATA_RESPONSE = StaticJSON({
+    "HC20": {
+        "unit": "mg/L",
+        "definition": "HC20 represents the environmental concentration affecting 20% of species.",
+        "why": "HC20 is used to calculate the Effect Factor (EF) of any chemical by taking the slope on the SSD at the HC20.",
+    },
+    "EC10eq": {
+        "unit": "mg/L",
+        "definition": "EC10eq values represent the concentration affecting 10% of a specific species based on relevant endpoints (e.g. LC50, EC50, etc.). They are used to construct the SSD.",
+        "why": "EC10eq values are used to construct the SSD of a chemical. These values are based on toxicological tests conducted on specific species.",
+    },
+    "SSD": {
+        "definition": "Species Sensitivity Distribution",
+        "summary": "SSD is constructed by fitting a log-normal distribution to chronic EC10eq toxicity endpoints from multiple species, showing the range of concentrations at which they are affected.",
+        "why": "SSD is used to calculate the Effect Factor (EF) of any chemical by taking the slope on the SSD at the HC20.",
+    },
+    "EF": {
+        "unit": "PAF·m³/kg",
+        "formula": "EF = O,2 / HC20",
+        "summary": "EF is the HC20 concentration-response slope factor expressed in PAF·m³·kg⁻¹.",
+        "details": "The Effect Factor represents the increase in the potentially affected fraction of species (PAF) per unit increase in chemical concentration, based on a concentration–response relationship.",
+    }
+})
+
+
 @router.get("/metadata")
-@apply_rate_limit("60/minute")
+@rate_limit_data()
 def get_metadata(request: Request):
     """
     Get contextual information about parameters and modules displayed in the frontend.
@@ -534,33 +669,12 @@ def get_metadata(request: Request):
         - SSD: Definition + Summary + Why
         - EF: Unit + Formula + Summary + Details
     """
-    return {
-        "HC20": {
-            "unit": "mg/L",
-            "definition": "HC20 represents the environmental concentration affecting 20% of species.",
-            "why": "HC20 is used to calculate the Effect Factor (EF) of any chemical by taking the slope on the SSD at the HC20.",
-        },
-        "EC10eq": {
-            "unit": "mg/L",
-            "definition": "EC10eq values represent the concentration affecting 10% of a specific species based on relevant endpoints (e.g. LC50, EC50, etc.). They are used to construct the SSD.",
-            "why": "EC10eq values are used to construct the SSD of a chemical. These values are based on toxicological tests conducted on specific species.",
-        },
-        "SSD": {
-            "definition": "Species Sensitivity Distribution",
-            "summary": "SSD is constructed by fitting a log-normal distribution to chronic EC10eq toxicity endpoints from multiple species, showing the range of concentrations at which they are affected.",
-            "why": "SSD is used to calculate the Effect Factor (EF) of any chemical by taking the slope on the SSD at the HC20.",
-        },
-        "EF": {
-            "unit": "PAF·m³/kg",
-            "formula": "EF = O,2 / HC20",
-            "summary": "EF is the HC20 concentration-response slope factor expressed in PAF·m³·kg⁻¹.",
-            "details": "The Effect Factor represents the increase in the potentially affected fraction of species (PAF) per unit increase in chemical concentration, based on a concentration–response relationship.",
-        }
-    }
+    return METADATA_RESPONSE.response(request)
 
 
 @router.get("/cas/{cas}")
-@apply_rate_limit("60/minute")
+@rate_limit_data()
+@cache_response()
 def get_cas_data(cas: str, request: Request):
     """
     Compile available effect factors (EF) for a specific chemical.
@@ -583,38 +697,38 @@ def get_cas_data(cas: str, request: Request):
     try:
         # Load benchmark data - Version is required
         df_benchmark = load_and_validate_benchmark_data(["cas_number", "name", "INCHIKEY", "Kingdom", "Superclass", "Class", "Source", "Version", "EF"])
-        substance_data = df_benchmark[df_benchmark["cas_number"] == cas]
+        positions = load_benchmark_cas_index().get(cas)
         
-        if substance_data.empty:
+        if positions is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Substance with CAS number '{cas}' not found in benchmark data. Please verify the CAS number is correct."
             )
         
+        substance_data = df_benchmark.iloc[positions]
+        
         # Get first entry and required fields
         required_fields = ["cas_number", "name", "INCHIKEY", "Kingdom", "Superclass", "Class"]
-        selected_data = substance_data[required_fields].iloc[0]
-        
-        # Convert to dict, handling NaN values for JSON serialization
-        data_record = {
-            field: None if pd.isna(selected_data[field]) else selected_data[field]
-            for field in required_fields
-        }
-        
-        # Build EffectFactor(s) list
-        effect_factors = []
-        for _, row in substance_data.iterrows():
-            try:
-                effect_factors.append({
-                    "Source": str(row["Source"]),
-                    "Version": None if pd.isna(row["Version"]) else str(row["Version"]),
-                    "EF": None if pd.isna(row["EF"]) else float(row["EF"])
-                })
-            except (ValueError, TypeError, KeyError) as e:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Error processing effect factor data for CAS '{cas}': {str(e)}"
-                )
+        selected_data = substance_data[required_fields].iloc[0].astype(object)
+        
+        # Convert to dict, replacing NaN values with None for JSON serialization
+        data_record = selected_data.where(selected_data.notna(), None).to_dict()
+        
+        # Build EffectFactor(s) list (column-wise conversion, NaN -> None)
+        try:
+            effect_factors = substance_data[["Source", "Version", "EF"]]
+            # Missing values are taken before the string cast, which turns
+            # NaN into "nan" on pandas < 3
+            present = effect_factors.notna()
+            effect_factors = effect_factors.astype(
+                {"Source": str, "Version": str, "EF": float}
+            ).astype(object)
+            effect_factors = effect_factors.where(present, None).to_dict("records")
+        except (ValueError, TypeError, KeyError) as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error processing effect factor data for CAS '{cas}': {str(e)}"
+            )
         
         data_record["EffectFactor(s)"] = effect_factors
         return data_record
@@ -625,7 +739,7 @@ def get_cas_data(cas: str, request: Request):
 
 
 @router.get("/search")
-@apply_rate_limit("60/minute")
+@rate_limit_data()
 def search_substances(
     request: Request,
     query: str = Query(..., description="Search term (CAS number or chemical name, partial match supported)"),
@@ -657,37 +771,36 @@ def search_substances(
         query_clean = validate_search_query(query)
         
         df = load_and_validate_ssd_data(["cas_number", "chemical_name"])
+        query_lower = query_clean.lower()
         
         # Helper function to format results
         def format_matches(results_df):
-            results = results_df[["cas_number", "chemical_name"]].drop_duplicates()
-            matches = [
-                {"cas": str(row["cas_number"]), "name": str(row["chemical_name"])}
-                for _, row in results.iterrows()
-            ]
+            # Count every unique match but only build dictionaries for the returned ones
+            unique_matches = results_df[["cas_number", "chemical_name"]].drop_duplicates()
             return {
                 "query": query,
-                "count": len(matches),
-                "matches": matches[:limit],
+                "count": len(unique_matches),
+                "matches": format_substance_matches(unique_matches.head(limit)),
             }
         
-        # Try exact CAS match first
-        cas_exact = df[df["cas_number"] == query_clean]
-        if not cas_exact.empty:
-            return format_matches(cas_exact)
+        # Try exact CAS match first (dictionary lookup on the canonical CAS form)
+        canonical_cas = canonicalize_cas(query_clean)
+        position = load_cas_index().get(canonical_cas) if canonical_cas else None
+        if position is not None:
+            return format_matches(df.iloc[[position]])
         
         # Try exact name match (case-insensitive)
-        name_exact = df[df["chemical_name"].str.lower() == query_clean.lower()]
+        name_exact = df.iloc[match_chemical_names(query_lower, exact=True)]
         if not name_exact.empty:
             return format_matches(name_exact)
         
-        # Try partial name match (case-insensitive)
-        name_partial = df[df["chemical_name"].str.lower().str.contains(query_clean.lower(), na=False)]
+        # Try partial name match (case-insensitive, literal substring without regex)
+        name_partial = df.iloc[match_chemical_names(query_lower)]
         if not name_partial.empty:
             return format_matches(name_partial)
         
-        # Try partial CAS match
-        cas_partial = df[df["cas_number"].str.contains(query_clean, na=False)]
+        # Try partial CAS match (literal substring without regex)
+        cas_partial = df[df["cas_number"].str.contains(query_clean, regex=False, na=False)]
         if not cas_partial.empty:
             return format_matches(cas_partial)
         
@@ -704,7 +817,8 @@ def search_substances(
 
 
 @router.get("/plot/ssd/{cas}")
-@apply_rate_limit("10/minute")
+@rate_limit_plot()
+@cache_response()
 def get_ssd_plot(cas: str, request: Request):
     """
     Get SSD (Species Sensitivity Distribution) data for a single chemical in JSON format.
@@ -724,13 +838,10 @@ def get_ssd_plot(cas: str, request: Request):
     # Validate CAS number input
     cas = validate_cas_number(cas)
     try:
-        df = load_and_validate_ssd_data()
-        
-        # Import and use the function from plot_ssd_curve
-        from data.graph.SSD.plot_ssd_curve import get_ssd_data
+        df = load_and_validate_ssd_data(columns=SSD_DATA_COLUMNS)
         
         # Get SSD data (get_ssd_data handles CAS validation internally)
-        ssd_data = get_ssd_data(df, cas)
+        ssd_data = plotting.get_ssd_data(df, cas)
         
         return ssd_data
     except HTTPException:
@@ -744,7 +855,8 @@ def get_ssd_plot(cas: str, request: Request):
 
 
 @router.get("/plot/ec10eq/{cas}")
-@apply_rate_limit("10/minute")
+@rate_limit_plot()
+@cache_response()
 def get_ec10eq_plot(cas: str, request: Request):
     """
     List all calculated EC10eq results per species and trophic group in JSON format.
@@ -762,11 +874,8 @@ def get_ec10eq_plot(cas: str, request: Request):
     # Validate CAS number input
     cas = validate_cas_number(cas) 
     try:
-        # Import data processing function (cached after first call)
-        get_ec10eq_data = _get_ec10eq_data_function()
-        
         # Call data processing function with API configuration
-        ec10eq_data = get_ec10eq_data(
+        ec10eq_data = plotting.get_ec10eq_data_json(
             cas_number=cas,
             data_path=str(DATA_PATH_ec10eq),
             output_format="detailed"
@@ -780,7 +889,8 @@ def get_ec10eq_plot(cas: str, request: Request):
 
 
 @router.post("/plot/ssd/comparison")
-@apply_rate_limit("10/minute")
+@rate_limit_plot()
+@cache_response()
 def get_ssd_comparison(request_body: ComparisonRequest, request: Request):
     """
     Get SSD (Species Sensitivity Distribution) data for multiple chemicals in JSON format.
@@ -812,19 +922,10 @@ def get_ssd_comparison(request_body: ComparisonRequest, request: Request):
         )
     
     try:
-        df = load_and_validate_ssd_data()
+        df = load_and_validate_ssd_data(columns=SSD_DATA_COLUMNS)
         
         # Resolve all identifiers to CAS numbers (API-level logic)
-        # Pass dataframe to avoid reloading data for each identifier
-        resolved_cas_list = []
-        invalid_identifiers = []
-        
-        for identifier in request_body.cas_list:
-            try:
-                resolved_cas = resolve_cas_from_identifier(identifier, dataframe=df)
-                resolved_cas_list.append(resolved_cas)
-            except ValueError as e:
-                invalid_identifiers.append(f"'{identifier}': {str(e)}")
+        resolved_cas_list, invalid_identifiers = resolve_cas_identifiers(request_body.cas_list, dataframe=df)
         
         if invalid_identifiers:
             raise HTTPException(
@@ -832,11 +933,8 @@ def get_ssd_comparison(request_body: ComparisonRequest, request: Request):
                 detail=f"Invalid or not found identifiers: {', '.join(invalid_identifiers)}"
             )
         
-        # Import data processing function (cached after first call)
-        get_ssd_comparison_data = _get_ssd_comparison_data_function()
-        
         # Call data processing function
-        comparison_data = get_ssd_comparison_data(
+        comparison_data = plotting.get_ssd_comparison_data(
             dataframe=df,
             cas_list=resolved_cas_list
         )
@@ -0,0 +1,161 @@
+"""
+Response caching for OpenChemFacts Backend API.
+
+This module provides an in-process cache for endpoints whose response only
+depends on their arguments and on the data files. The data files are loaded
+once per process (see data_loader.py), so a cached response stays valid for
+the lifetime of the process. An optional time-to-live bounds how long a
+response is served from the cache (RESPONSE_CACHE_TTL, in seconds).
+
+Only use this cache on public endpoints that return the same response to
+every client. The LRUCache class behind the decorator is also used directly
+for other per-process lookups (e.g. the resolved CAS numbers in api.py).
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from pydantic import BaseModel
+from starlette.requests import Request
+
+# Maximum number of cached responses per endpoint
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))
+
+# Time-to-live of cached responses in seconds (0 = keep until evicted)
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "0"))
+
+# Returned by LRUCache.get for missing or expired keys (None is a valid value)
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe least recently used cache with an optional time-to-live.
+
+    Args:
+        maxsize: Maximum number of entries
+        ttl: Time-to-live of an entry in seconds (None or 0 = no expiry)
+
+    Example:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.set("a", 1)
+        >>> cache.get("a")
+        1
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry time or None, value), least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value stored for a key and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is missing or expired
+
+        Returns:
+            Cached value, or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _make_key(kwargs: dict) -> Hashable:
+    """
+    Build a cache key from endpoint keyword arguments.
+
+    The Request object is ignored (it differs for every call) and Pydantic
+    request bodies are keyed on their JSON representation.
+
+    Args:
+        kwargs: Keyword arguments passed to the endpoint
+
+    Returns:
+        Hashable cache key
+    """
+    key = []
+    for name, value in sorted(kwargs.items()):
+        if isinstance(value, Request):
+            continue
+        if isinstance(value, BaseModel):
+            value = value.model_dump_json()
+        key.append((name, value))
+    return tuple(key)
+
+
+def cache_response(maxsize: int = RESPONSE_CACHE_SIZE, ttl: Optional[float] = RESPONSE_CACHE_TTL) -> Callable:
+    """
+    Decorator caching the return value of an endpoint (least recently used).
+
+    Exceptions (e.g. HTTPException for unknown CAS numbers) are not cached.
+    Place this decorator below the rate limit decorator so that cached
+    responses are still rate limited.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        ttl: Time-to-live of a cached response in seconds (None or 0 = no expiry)
+
+    Returns:
+        Decorator for endpoint functions
+
+    Example:
+        >>> @router.get("/summary")
+        ... @rate_limit_data()
+        ... @cache_response()
+        ... def get_summary(request: Request):
+        ...     ...
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = LRUCache(maxsize, ttl)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(kwargs)
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+
+            result = func(*args, **kwargs)
+            cache.set(key, result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -5,8 +5,10 @@ This module centralizes configuration settings that can be customized
 via environment variables or default values.
 """
 import os
+import re
+from functools import cache
 from pathlib import Path
-from typing import List
+from typing import FrozenSet
 
 
 # Base paths
@@ -41,21 +43,22 @@ LOVABLEPROJECT_REGEX = r"https://.*\.lovableproject\.com"
 LOCALHOST_REGEX = r"http://localhost:\d+|http://127\.0\.0\.1:\d+"
 
 
-def get_allowed_origins() -> List[str]:
+@cache
+def get_allowed_origins() -> FrozenSet[str]:
     """
-    Get list of allowed CORS origins.
+    Get the set of allowed CORS origins.
     
     Reads from ALLOWED_ORIGINS environment variable if set,
-    otherwise returns default origins.
+    otherwise returns default origins. The variable is parsed once per process.
     
     Returns:
-        List of allowed origin strings
+        Frozenset of allowed origin strings (constant-time membership test)
     """
     allowed_origins_str = os.getenv(
         "ALLOWED_ORIGINS",
         ",".join(DEFAULT_ALLOWED_ORIGINS)
     )
-    return [origin.strip() for origin in allowed_origins_str.split(",") if origin.strip()]
+    return frozenset(origin.strip() for origin in allowed_origins_str.split(",") if origin.strip())
 
 
 def get_cors_regex() -> str:
@@ -68,6 +71,11 @@ def get_cors_regex() -> str:
     return f"{LOVABLE_APP_REGEX}|{LOVABLEPROJECT_REGEX}|{LOCALHOST_REGEX}"
 
 
+# Combined CORS regex, compiled once at import
+# (CORSMiddleware matches it against the whole Origin header)
+CORS_ORIGIN_REGEX = re.compile(get_cors_regex(), re.ASCII)
+
+
 # Server Configuration
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 8000
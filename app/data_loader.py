@@ -2,14 +2,33 @@
 Data loading module for OpenChemFacts Backend.
 
 This module provides functions to load ecotoxicology data from Parquet files.
-The data is cached using lru_cache to improve performance by avoiding
-repeated file reads.
+The data is cached using functools.cache / lru_cache to improve performance
+by avoiding repeated file reads.
+
+Each Parquet file is decoded once per process into an Arrow table. The pandas
+and polars loaders build their DataFrames from that shared table instead of
+reading the file again. The pandas loaders accept an optional tuple of column
+names so that callers only convert the columns they actually use. Each column
+selection is cached independently.
 """
-from functools import lru_cache
-import pandas as pd
-import polars as pl
+from __future__ import annotations
+
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pathlib import Path
 import logging
+import re
+
+# pandas and polars are imported by the loaders on first use, so that
+# importing the API does not pay for both libraries up front
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
 logger = logging.getLogger(__name__)
 
 # Path to the data file
@@ -18,14 +37,208 @@ DATA_PATH_ssd = Path(__file__).resolve().parent.parent / "data" / "results_ecoto
 DATA_PATH_ec10eq = Path(__file__).resolve().parent.parent / "data" / "results_ecotox_EC10_list_per_species.parquet"
 DATA_PATH_benchmark = Path(__file__).resolve().parent.parent / "data" / "results_EF_benchmark.parquet"
 
-@lru_cache(maxsize=1)
-def load_data() -> pd.DataFrame:
+# Benchmark columns with few distinct values, stored as pandas categoricals
+# so that equality filters and counts run on integer codes
+BENCHMARK_CATEGORICAL_COLUMNS = ("Source", "cas_number", "INCHIKEY")
+
+# CAS number written with dashes, optionally with spaces around them
+# (e.g. "50-00-0", "50-0-0", "050 - 00 - 0")
+CAS_PATTERN = re.compile(r"^(\d{1,7})\s*-\s*(\d{1,2})\s*-\s*(\d)$")
+
+
+def arrow_cache_path(path: Path) -> Path:
+    """
+    Return the path of the Arrow IPC copy of a Parquet file.
+    
+    Args:
+        path: Path to the Parquet file
+        
+    Returns:
+        Path: Same path with the ".arrow" extension
+    """
+    return path.with_suffix(".arrow")
+
+
+def _read_arrow_cache(path: Path) -> Optional[pa.Table]:
+    """
+    Read the Arrow IPC copy of a Parquet file, if it is usable.
+    
+    The IPC file is memory-mapped: its on-disk layout is the in-memory Arrow
+    layout, so the returned table points into the mapping without any
+    decompression or decoding. A copy older than the Parquet file is ignored.
+    
+    Args:
+        path: Path to the Parquet file
+        
+    Returns:
+        pyarrow.Table read from the IPC copy, or None if there is no up to
+        date copy
+    """
+    arrow_path = arrow_cache_path(path)
+    if not arrow_path.is_file():
+        logger.debug(
+            "No Arrow IPC copy of %s, reading Parquet "
+            "(written at build time by bin/post_compile: python -m app.data_loader)",
+            path.name,
+        )
+        return None
+    if arrow_path.stat().st_mtime < path.stat().st_mtime:
+        logger.warning("Ignoring %s: older than %s", arrow_path.name, path.name)
+        return None
+    source = pa.memory_map(str(arrow_path), "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+@lru_cache(maxsize=4)
+def _load_table(path: Path) -> pa.Table:
+    """
+    Read a Parquet file into an Arrow table, once per process.
+    
+    The pandas and polars loaders of a file share this table, so the file is
+    read and decompressed only once whatever the number of loaders and column
+    selections. An up to date Arrow IPC copy of the file (see
+    write_arrow_cache) is memory-mapped instead when present. Otherwise the
+    Parquet file is memory-mapped rather than copied into an intermediate
+    read buffer before decoding.
+    
+    Args:
+        path: Path to the Parquet file
+        
+    Returns:
+        pyarrow.Table: Content of the Parquet file
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    # Single existence check per file, the table is cached afterwards
+    if not path.is_file():
+        raise FileNotFoundError(f"Data file not found at {path}")
+    table = _read_arrow_cache(path)
+    if table is not None:
+        return table
+    # pre_buffer coalesces the reads of all column chunks of a row group into
+    # large ranges instead of one small read per column chunk
+    return pq.read_table(path, memory_map=True, pre_buffer=True, use_threads=True)
+
+
+def write_arrow_cache(path: Path) -> Path:
+    """
+    Write an uncompressed Arrow IPC copy of a Parquet file next to it.
+    
+    Meant to run once at build time (bin/post_compile runs
+    python -m app.data_loader), so that each process start maps the copy
+    instead of decompressing the Parquet file.
+    
+    Args:
+        path: Path to the Parquet file
+        
+    Returns:
+        Path: Path of the written IPC file
+        
+    Example:
+        >>> write_arrow_cache(DATA_PATH_ssd)
+        PosixPath('.../data/results_ecotox_ssd.arrow')
+    """
+    table = pq.read_table(path)
+    arrow_path = arrow_cache_path(path)
+    # Write to a temporary file first so that a running process never maps
+    # a partially written file
+    tmp_path = arrow_path.with_suffix(".arrow.tmp")
+    with pa.OSFile(str(tmp_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    tmp_path.replace(arrow_path)
+    logger.info("Arrow IPC copy written: %s", arrow_path)
+    return arrow_path
+
+
+def _select_columns(table: pa.Table, columns: Optional[Tuple[str, ...]]) -> pa.Table:
+    """
+    Restrict a table to the requested columns that it contains.
+    
+    Columns missing from the table are dropped from the selection so that
+    callers can report them with a clear error instead of failing on the
+    selection itself. Selecting columns does not copy any data.
+    
+    Args:
+        table: Arrow table
+        columns: Requested column names, or None for all columns
+        
+    Returns:
+        pyarrow.Table: Table with the selected columns
+    """
+    if columns is None:
+        return table
+    available = set(table.column_names)
+    return table.select([column for column in columns if column in available])
+
+
+def _to_pandas(
+    path: Path,
+    columns: Optional[Tuple[str, ...]],
+    label: str,
+    categorical_columns: Tuple[str, ...] = (),
+) -> pd.DataFrame:
+    """
+    Convert the requested columns of a cached Parquet table to pandas.
+    
+    Shared body of the pandas loaders, which only differ by data file.
+    
+    Args:
+        path: Path to the Parquet file
+        columns: Requested column names, or None for all columns
+        label: Name of the data used in log messages (e.g., "Benchmark data")
+        categorical_columns: Columns to store as pandas categoricals
+        
+    Returns:
+        pandas.DataFrame: DataFrame with the selected columns
+    """
+    logger.info("Loading %s from: %s", label.lower(), path)
+    
+    # Convert only the requested columns of the shared Arrow table
+    df = _select_columns(_load_table(path), columns).to_pandas(split_blocks=True)
+    for column in categorical_columns:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    logger.info("%s loaded: %s rows, %s columns", label, df.shape[0], df.shape[1])
+    
+    return df
+
+
+def _to_polars(path: Path, label: str) -> pl.DataFrame:
+    """
+    Wrap a cached Parquet table in a Polars DataFrame (no copy).
+    
+    Shared body of the polars loaders, which only differ by data file.
+    
+    Args:
+        path: Path to the Parquet file
+        label: Name of the data used in log messages (e.g., "Benchmark data")
+        
+    Returns:
+        polars.DataFrame: DataFrame with all columns of the file
+    """
+    import polars as pl
+    
+    logger.info("Loading %s (Polars) from: %s", label.lower(), path)
+    
+    df = pl.from_arrow(_load_table(path), rechunk=False)
+    logger.info("%s loaded (Polars): %s rows, %s columns", label, df.height, df.width)
+    
+    return df
+
+
+@lru_cache(maxsize=8)
+def load_data(columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
     """
     Load ecotoxicology data as a pandas DataFrame.
     
     This function uses caching (@lru_cache) to load the data only once
     and reuse it for subsequent calls, improving performance.
     
+    Args:
+        columns: Optional tuple of column names to read. If None, all columns are read.
+    
     Returns:
         pandas.DataFrame: DataFrame containing ecotoxicology data
         
@@ -36,20 +249,123 @@ def load_data() -> pd.DataFrame:
         >>> df = load_data()
         >>> print(df.head())
     """
-    logger.info(f"Loading data from: {DATA_PATH_ssd}")
-    logger.info(f"File exists: {DATA_PATH_ssd.exists()}")
+    return _to_pandas(DATA_PATH_ssd, columns, "Data")
+
+
+@cache
+def load_data_row_count() -> int:
+    """
+    Return the number of rows of the ecotoxicology data.
+    
+    The count is read from the shared Arrow table, so no pandas DataFrame
+    is built or touched (used by the /health endpoint).
     
-    if not DATA_PATH_ssd.exists():
-        raise FileNotFoundError(f"Data file not found at {DATA_PATH_ssd}")
+    Returns:
+        int: Number of rows in the SSD data file
+        
+    Raises:
+        FileNotFoundError: If the data file doesn't exist at DATA_PATH_ssd
+    """
+    return _load_table(DATA_PATH_ssd).num_rows
+
+
+@cache
+def load_chemical_names_lower() -> pa.Array:
+    """
+    Load the lowercased chemical names of the SSD data as an Arrow string array.
     
-    # Read the Parquet file
-    df = pd.read_parquet(DATA_PATH_ssd)
-    logger.info(f"Data loaded: {df.shape[0]} rows, {df.shape[1]} columns")
+    Names are lowercased once here instead of on every search request, so
+    that case-insensitive matching becomes a vectorized Arrow compute kernel
+    (pyarrow.compute.equal / match_substring).
+    Positions are aligned with the rows of load_data() (whatever the selected
+    columns, all variants are read from the same file). Missing names are
+    stored as empty strings.
     
-    return df
+    Returns:
+        pyarrow.Array: String array of lowercased chemical names
+        
+    Raises:
+        FileNotFoundError: If the data file doesn't exist at DATA_PATH_ssd
+    """
+    names = _load_table(DATA_PATH_ssd).column("chemical_name")
+    names = pc.fill_null(names, "").to_numpy(zero_copy_only=False).astype(str)
+    # Lowercase with Python semantics (same result as str.lower())
+    return pa.array(np.char.lower(names), type=pa.string())
 
 
-@lru_cache(maxsize=1)
+def canonicalize_cas(value: str) -> Optional[str]:
+    """
+    Convert a CAS number to its canonical "NNNNNNN-NN-N" form.
+    
+    Surrounding whitespace and leading zeros of the first group are removed
+    and the middle group is zero-padded to two digits.
+    
+    Args:
+        value: CAS number string (e.g., " 50-0-0 ")
+        
+    Returns:
+        Canonical CAS number (e.g., "50-00-0"), or None if value is not
+        written as a CAS number
+        
+    Example:
+        >>> canonicalize_cas("050-0-0")
+        '50-00-0'
+        >>> canonicalize_cas("formaldehyde") is None
+        True
+    """
+    match = CAS_PATTERN.match(value.strip())
+    if match is None:
+        return None
+    first, middle, check = match.groups()
+    return f"{int(first)}-{middle.zfill(2)}-{check}"
+
+
+@cache
+def load_cas_index() -> Dict[str, int]:
+    """
+    Map canonical CAS numbers of the SSD data to their row position.
+    
+    The index is built once so that exact CAS lookups are a dictionary
+    access instead of a scan of the cas_number column. Positions are aligned
+    with the rows of load_data(), whatever the selected columns.
+    
+    Returns:
+        dict: Canonical CAS number -> row position in load_data()
+        
+    Raises:
+        FileNotFoundError: If the data file doesn't exist at DATA_PATH_ssd
+    """
+    cas_numbers = _load_table(DATA_PATH_ssd).column("cas_number").to_pylist()
+    index = {}
+    for position, cas in enumerate(cas_numbers):
+        canonical = canonicalize_cas(cas) if cas is not None else None
+        if canonical is not None:
+            # Keep the first row if a CAS number appears more than once
+            index.setdefault(canonical, position)
+    return index
+
+
+@cache
+def load_benchmark_cas_index() -> Dict[str, np.ndarray]:
+    """
+    Map each CAS number of the benchmark data to its row positions.
+    
+    A CAS number has one row per source in the benchmark data. The index is
+    built once so that point lookups by CAS number do not scan the whole
+    cas_number column. Positions are aligned with the rows of
+    load_benchmark_data(), whatever the selected columns.
+    
+    Returns:
+        dict: CAS number -> array of row positions in load_benchmark_data()
+        
+    Raises:
+        FileNotFoundError: If the data file doesn't exist at DATA_PATH_benchmark
+    """
+    df = _select_columns(_load_table(DATA_PATH_benchmark), ("cas_number",)).to_pandas()
+    return df.groupby("cas_number", sort=False).indices
+
+
+@cache
 def load_data_polars() -> pl.DataFrame:
     """
     Load ecotoxicology data as a Polars DataFrame.
@@ -58,7 +374,7 @@ def load_data_polars() -> pl.DataFrame:
     on large datasets. This function is used by plotting functions
     that need better performance.
     
-    This function uses caching (@lru_cache) to load the data only once
+    This function uses caching (@cache) to load the data only once
     and reuse it for subsequent calls.
     
     Returns:
@@ -71,27 +387,20 @@ def load_data_polars() -> pl.DataFrame:
         >>> df = load_data_polars()
         >>> print(df.head())
     """
-    logger.info(f"Loading data (Polars) from: {DATA_PATH_ssd}")
-    logger.info(f"File exists: {DATA_PATH_ssd.exists()}")
-    
-    if not DATA_PATH_ssd.exists():
-        raise FileNotFoundError(f"Data file not found at {DATA_PATH_ssd}")
-    
-    # Read the Parquet file with Polars
-    df = pl.read_parquet(DATA_PATH_ssd)
-    logger.info(f"Data loaded (Polars): {df.height} rows, {df.width} columns")
-    
-    return df
+    return _to_polars(DATA_PATH_ssd, "Data")
 
 
-@lru_cache(maxsize=1)
-def load_benchmark_data() -> pd.DataFrame:
+@lru_cache(maxsize=8)
+def load_benchmark_data(columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
     """
     Load benchmark data as a pandas DataFrame.
     
     This function uses caching (@lru_cache) to load the data only once
     and reuse it for subsequent calls, improving performance.
     
+    Args:
+        columns: Optional tuple of column names to read. If None, all columns are read.
+    
     Returns:
         pandas.DataFrame: DataFrame containing benchmark data
         
@@ -102,20 +411,10 @@ def load_benchmark_data() -> pd.DataFrame:
         >>> df = load_benchmark_data()
         >>> print(df.head())
     """
-    logger.info(f"Loading benchmark data from: {DATA_PATH_benchmark}")
-    logger.info(f"File exists: {DATA_PATH_benchmark.exists()}")
-    
-    if not DATA_PATH_benchmark.exists():
-        raise FileNotFoundError(f"Benchmark data file not found at {DATA_PATH_benchmark}")
-    
-    # Read the Parquet file
-    df = pd.read_parquet(DATA_PATH_benchmark)
-    logger.info(f"Benchmark data loaded: {df.shape[0]} rows, {df.shape[1]} columns")
-    
-    return df
+    return _to_pandas(DATA_PATH_benchmark, columns, "Benchmark data", BENCHMARK_CATEGORICAL_COLUMNS)
 
 
-@lru_cache(maxsize=1)
+@cache
 def load_benchmark_data_polars() -> pl.DataFrame:
     """
     Load benchmark data as a Polars DataFrame.
@@ -124,7 +423,7 @@ def load_benchmark_data_polars() -> pl.DataFrame:
     on large datasets. This function is used by plotting functions
     that need better performance.
     
-    This function uses caching (@lru_cache) to load the data only once
+    This function uses caching (@cache) to load the data only once
     and reuse it for subsequent calls.
     
     Returns:
@@ -137,14 +436,28 @@ def load_benchmark_data_polars() -> pl.DataFrame:
         >>> df = load_benchmark_data_polars()
         >>> print(df.head())
     """
-    logger.info(f"Loading benchmark data (Polars) from: {DATA_PATH_benchmark}")
-    logger.info(f"File exists: {DATA_PATH_benchmark.exists()}")
-    
-    if not DATA_PATH_benchmark.exists():
-        raise FileNotFoundError(f"Benchmark data file not found at {DATA_PATH_benchmark}")
+    return _to_polars(DATA_PATH_benchmark, "Benchmark data")
+
+
+def preload_data() -> None:
+    """
+    Load the data files and lookup indexes used by the API endpoints.
     
-    # Read the Parquet file with Polars
-    df = pl.read_parquet(DATA_PATH_benchmark)
-    logger.info(f"Benchmark data loaded (Polars): {df.height} rows, {df.width} columns")
+    Called once at application startup so that the first requests do not pay
+    for reading and decoding the Parquet files.
     
-    return df
\ No newline at end of file
+    Raises:
+        FileNotFoundError: If a data file is missing
+    """
+    load_data_row_count()
+    load_chemical_names_lower()
+    load_cas_index()
+    load_benchmark_cas_index()
+    logger.info("Data preloaded")
+
+
+if __name__ == "__main__":
+    # python -m app.data_loader: write the Arrow IPC copies of the data files
+    logging.basicConfig(level=logging.INFO)
+    for data_path in (DATA_PATH_ssd, DATA_PATH_ec10eq, DATA_PATH_benchmark):
+        write_arrow_cache(data_path)
@@ -9,25 +9,58 @@ This module creates and configures the FastAPI application, including:
 """
 import os
 import sys
+import asyncio
 import logging
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+import math
+import time
+import orjson
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from fastapi import FastAPI, Request, Response
 from slowapi.errors import RateLimitExceeded
 from . import api
-from .middleware import (
-    SecurityHeadersMiddleware,
-    RequestSizeLimitMiddleware,
-    SecurityLoggingMiddleware
-)
+from .middleware import SecurityMiddleware, OriginSetCORSMiddleware
 from .security import limiter, RATE_LIMIT_ENABLED, rate_limit_health
+from .data_loader import preload_data, load_data_row_count
+from .config import CORS_ORIGIN_REGEX, LOG_LEVEL, get_allowed_origins
+from .responses import ORJSONResponse, StaticJSON
 
 # Configuration du logging
-logging.basicConfig(level=logging.INFO)
+# LOG_LEVEL=WARNING en production évite le log INFO de chaque requête
+logging.basicConfig(level=LOG_LEVEL.upper())
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Preload the data before the application starts serving requests.
+    
+    The Parquet files are decoded in a worker thread so that the event loop
+    is not blocked. A loading error is logged and reported by /health instead
+    of preventing the application from starting.
+    """
+    try:
+        await asyncio.to_thread(preload_data)
+    except Exception as e:
+        logger.error("Failed to preload data: %s", e)
+    yield
+
+
+IS_PRODUCTION = os.getenv("ENVIRONMENT", "development").lower() == "production"
+
+# Swagger UI, ReDoc and the OpenAPI schema are disabled by default in production
+# (ENABLE_DOCS=true keeps them)
+ENABLE_DOCS = os.getenv("ENABLE_DOCS", "false" if IS_PRODUCTION else "true").lower() == "true"
+
 # Create FastAPI application instance
+# Responses are serialized with orjson (faster than the standard json module)
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    openapi_url="/openapi.json" if ENABLE_DOCS else None,
+    docs_url="/docs" if ENABLE_DOCS else None,
+    redoc_url="/redoc" if ENABLE_DOCS else None,
     title="openchemfacts_API_0.1",
     version="0.1.0",
     description="OpenChemFacts is an open-data platform dedicated to the assessment of chemicals' ecotoxicity. <br>API for accessing ecotoxicology data and generating scientific visualizations<br><br><b>License:</b> This OpenChemFacts database is made available under the Open Database License: http://opendatacommons.org/licenses/odbl/1.0/. Any rights in individual contents of the database are licensed under the Database Contents License: http://opendatacommons.org/licenses/dbcl/1.0/"
@@ -44,11 +77,16 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     
     Returns a 429 Too Many Requests response with retry-after information.
     """
-    response = JSONResponse(
+    # Seconds until the current rate limit window resets
+    limit_item, limit_args = request.state.view_rate_limit
+    window = request.app.state.limiter.limiter.get_window_stats(limit_item, *limit_args)
+    retry_after = max(0, math.ceil(window.reset_time - time.time()))
+    
+    response = ORJSONResponse(
         status_code=429,
         content={
             "detail": "Rate limit exceeded. Please try again later.",
-            "retry_after": exc.retry_after
+            "retry_after": retry_after
         }
     )
     response = request.app.state.limiter._inject_headers(
@@ -56,23 +94,29 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     )
     return response
 
+# Body of the 500 response in production, serialized once at import
+PRODUCTION_ERROR_BODY = orjson.dumps({"detail": "Internal server error"})
+
 # Add global exception handler for debugging
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """
     Global exception handler to catch any unhandled exceptions.
+    
+    The exception is only formatted by the logging handler (lazy % arguments),
+    and the production response body is pre-serialized.
     """
-    logger.error(f"Unhandled exception: {type(exc).__name__}: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s: %s", type(exc).__name__, exc, exc_info=exc)
+    if IS_PRODUCTION:
+        return Response(content=PRODUCTION_ERROR_BODY, status_code=500, media_type="application/json")
+    return ORJSONResponse(
         status_code=500,
-        content={
-            "detail": f"Internal server error: {str(exc)}" if os.getenv("ENVIRONMENT", "development").lower() != "production" else "Internal server error"
-        }
+        content={"detail": f"Internal server error: {exc}"}
     )
 
 # Log au démarrage pour le débogage
 logger.info("Starting OpenChemFacts API")
-logger.info(f"Python version: {sys.version}")
+logger.info("Python version: %s", sys.version)
 
 # Configuration CORS (Cross-Origin Resource Sharing)
 # Permet au frontend d'appeler l'API depuis différents domaines
@@ -92,37 +136,26 @@ logger.info(f"Python version: {sys.version}")
 # Pour le développement local :
 #   export ALLOWED_ORIGINS=https://example.com,https://www.example.com
 #   (ou définir dans votre IDE/environnement de développement)
-allowed_origins_str = os.getenv(
-    "ALLOWED_ORIGINS",
-    "https://openchemfacts.com,https://www.openchemfacts.com,https://openchemfacts.lovable.app,https://lovableproject.com,http://localhost:3000,http://localhost:5173,http://127.0.0.1:3000,http://127.0.0.1:5173"
-)
-allowed_origins = [origin.strip() for origin in allowed_origins_str.split(",") if origin.strip()]
+# 
+# La lecture de ALLOWED_ORIGINS et les origines par défaut sont dans config.py
+allowed_origins = get_allowed_origins()
 
-# Regex pour autoriser automatiquement :
+# Regex pour autoriser automatiquement (CORS_ORIGIN_REGEX, compilée une fois dans config.py) :
 # - Tous les sous-domaines de lovable.app (domaines Lovable en production)
 # - Tous les sous-domaines de lovableproject.com
 # - Tous les ports de localhost (pour le développement)
-lovable_app_regex = r"https://.*\.lovable\.app"
-lovableproject_regex = r"https://.*\.lovableproject\.com"
-localhost_regex = r"http://localhost:\d+|http://127\.0\.0\.1:\d+"
-
-logger.info(f"CORS allowed origins: {allowed_origins}")
-
-# Add security middleware (order matters - add before CORS)
-# Security logging should be first to log all requests
-app.add_middleware(SecurityLoggingMiddleware)
 
-# Request size limiting
-app.add_middleware(RequestSizeLimitMiddleware)
+logger.info("CORS allowed origins: %s", sorted(allowed_origins))
 
-# Security headers
-app.add_middleware(SecurityHeadersMiddleware)
+# Add security middleware (security headers, request size limits, security
+# logging in a single middleware), before CORS
+app.add_middleware(SecurityMiddleware)
 
 # Ajouter le middleware CORS à l'application
 app.add_middleware(
-    CORSMiddleware,
+    OriginSetCORSMiddleware,
     allow_origins=allowed_origins,
-    allow_origin_regex=f"{lovable_app_regex}|{lovableproject_regex}|{localhost_regex}",
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],  # Autorise toutes les méthodes HTTP (GET, POST, etc.)
     allow_headers=["*"],  # Autorise tous les headers
@@ -133,6 +166,34 @@ app.add_middleware(
 app.include_router(api.router, prefix="/api", tags=["api"])
 
 
+# Static responses of "/" and "/api/license", serialized once at import
+LICENSE_RESPONSE = StaticJSON({
+    **api.get_license_notice(),
+    "local_files": {
+        "odbl": "LICENSE_ODBL.txt",
+        "dbcl": "LICENSE_DBCL.txt",
+        "data_notice": "data/LICENSE_NOTICE.txt"
+    }
+})
+
+ROOT_RESPONSE = StaticJSON({
+    "message": "OpenChemFacts API v0.1.0",
+    "status": "running",
+    "endpoints": {
+        "health": "/health",
+        **({"documentation": "/docs", "redoc": "/redoc"} if ENABLE_DOCS else {}),
+        "api_summary": "/api/summary",
+        "api_metadata": "/api/metadata",
+        "api_cas": "/api/cas/{cas}",
+        "api_search": "/api/search?query={query}&limit={limit}",
+        "api_plot_ssd": "/api/plot/ssd/{identifier}",
+        "api_plot_ec10eq": "/api/plot/ec10eq/{identifier}",
+        "api_plot_comparison": "/api/plot/ssd/comparison",
+        "api_license": "/api/license"
+    }
+})
+
+
 @app.get("/api/license")
 @rate_limit_health()
 def get_license_info(request: Request):
@@ -147,16 +208,7 @@ def get_license_info(request: Request):
         - notice: Standard license notice text
         - local_files: Information about local license files in the project
     """
-    from .api import get_license_notice
-    
-    license_info = get_license_notice()
-    license_info["local_files"] = {
-        "odbl": "LICENSE_ODBL.txt",
-        "dbcl": "LICENSE_DBCL.txt",
-        "data_notice": "data/LICENSE_NOTICE.txt"
-    }
-    
-    return license_info
+    return LICENSE_RESPONSE.response(request)
 
 
 @app.get("/")
@@ -171,28 +223,75 @@ def root(request: Request):
         - status: Current API status
         - endpoints: List of available API endpoints with descriptions
     """
-    return {
-        "message": "OpenChemFacts API v0.1.0",
-        "status": "running",
-        "endpoints": {
-            "health": "/health",
-            "documentation": "/docs",
-            "redoc": "/redoc",
-            "api_summary": "/api/summary",
-            "api_metadata": "/api/metadata",
-            "api_cas": "/api/cas/{cas}",
-            "api_search": "/api/search?query={query}&limit={limit}",
-            "api_plot_ssd": "/api/plot/ssd/{identifier}",
-            "api_plot_ec10eq": "/api/plot/ec10eq/{identifier}",
-            "api_plot_comparison": "/api/plot/ssd/comparison",
-            "api_license": "/api/license"
-        }
-    }
+    return ROOT_RESPONSE.response(request)
+
+
+# Data status reported by /health, refreshed at most every HEALTH_TTL_SECONDS
+# (errors are retried sooner) so that frequent probes do not hit the loader
+HEALTH_TTL = float(os.getenv("HEALTH_TTL_SECONDS", "30"))
+HEALTH_ERROR_TTL = 5.0
+_health_cache: Optional[Tuple[float, str, int]] = None  # (expires_at, status, rows)
+_health_lock = asyncio.Lock()
+
+
+async def get_data_health() -> Tuple[str, int]:
+    """
+    Return the data status and row count reported by /health.
+    
+    The result is cached for HEALTH_TTL seconds (HEALTH_ERROR_TTL seconds
+    after a loading error). Concurrent probes arriving when the entry has
+    expired wait for a single check instead of each running one.
+    
+    Returns:
+        Tuple of (status, rows): status is "ok" or "error: <message>"
+    """
+    global _health_cache
+    cached = _health_cache
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1], cached[2]
+    
+    async with _health_lock:
+        now = time.monotonic()
+        cached = _health_cache
+        if cached is not None and now < cached[0]:
+            return cached[1], cached[2]
+        try:
+            # Vérifier que les données peuvent être chargées (nombre de lignes en cache)
+            data_rows = await asyncio.to_thread(load_data_row_count)
+            _health_cache = (now + HEALTH_TTL, "ok", data_rows)
+        except Exception as e:
+            # Si le chargement échoue, on retourne quand même une réponse
+            # mais avec un statut d'erreur dans data.status
+            logger.error("Health check failed to load data: %s", e)
+            _health_cache = (now + HEALTH_ERROR_TTL, f"error: {e}", 0)
+        return _health_cache[1], _health_cache[2]
+
+
+# (second, ISO 8601 timestamp) of the last /health response
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+
+def get_utc_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string (e.g. "2025-01-01T12:00:00Z").
+    
+    The timestamp has a one second resolution and is formatted at most once
+    per second, whatever the number of /health probes.
+    
+    Returns:
+        Current UTC timestamp string
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        timestamp = datetime.fromtimestamp(now, timezone.utc).isoformat().replace("+00:00", "Z")
+        _timestamp_cache = (now, timestamp)
+    return _timestamp_cache[1]
 
 
 @app.get("/health")
 @rate_limit_health()
-def health(request: Request):
+async def health(request: Request):
     """
     Health check endpoint to verify API and data availability.
     
@@ -204,28 +303,16 @@ def health(request: Request):
     Returns:
         Dictionary containing:
         - status: Overall API status (always "ok" if endpoint is reachable)
-        - timestamp: Current UTC timestamp
+        - timestamp: Current UTC time in ISO 8601 format, with a one second
+          resolution (e.g. "2025-01-01T12:00:00Z", no fractional seconds)
         - data: Data loading status and row count
         - version: API version number
     """
-    from datetime import datetime
-    
-    try:
-        # Vérifier que les données peuvent être chargées
-        from .data_loader import load_data
-        df = load_data()
-        data_status = "ok"
-        data_rows = len(df)
-    except Exception as e:
-        # Si le chargement échoue, on retourne quand même une réponse
-        # mais avec un statut d'erreur dans data.status
-        data_status = f"error: {str(e)}"
-        data_rows = 0
-        logger.error(f"Health check failed to load data: {str(e)}")
+    data_status, data_rows = await get_data_health()
     
     return {
         "status": "ok",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": get_utc_timestamp(),
         "data": {
             "status": data_status,
             "rows": data_rows
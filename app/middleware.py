@@ -5,13 +5,15 @@ This module provides middleware for:
 - Security HTTP headers
 - Request size limiting
 - Security logging
+- CORS origin checks against a set of allowed origins
 """
 import os
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from fastapi import status
+from .security import X_FORWARDED_FOR
 
 logger = logging.getLogger(__name__)
 
@@ -19,127 +21,175 @@ logger = logging.getLogger(__name__)
 # Par défaut, activé pour la sécurité de base
 ENABLE_SECURITY_HEADERS = os.getenv("ENABLE_SECURITY_HEADERS", "true").lower() == "true"
 MAX_REQUEST_SIZE = int(os.getenv("MAX_REQUEST_SIZE", "2097152"))  # Default: 2MB (plus permissif en développement)
+MAX_REQUEST_SIZE_DIGITS = len(str(MAX_REQUEST_SIZE))
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+# Basic Content Security Policy, as a single bytes constant
+# Allow same-origin and data URIs for images, scripts, styles
+# Allow cdn.jsdelivr.net for Swagger UI resources
+CONTENT_SECURITY_POLICY = (
+    b"default-src 'self'; "
+    b"script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net; "
+    b"style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
+    b"img-src 'self' data: https:; "
+    b"font-src 'self' data: https://cdn.jsdelivr.net; "
+    b"connect-src 'self'"
+)
+
+# Security headers added to every response, encoded once at import
+SECURITY_HEADERS = [
+    # Prevent MIME type sniffing
+    (b"x-content-type-options", b"nosniff"),
+    # Prevent clickjacking
+    (b"x-frame-options", b"DENY"),
+    # Enable XSS protection
+    (b"x-xss-protection", b"1; mode=block"),
+    # Basic Content Security Policy
+    (b"content-security-policy", CONTENT_SECURITY_POLICY),
+]
+
+# HSTS - Only added if X-Forwarded-Proto indicates HTTPS
+# In production behind a proxy, the proxy should handle this
+SECURITY_HEADERS_HTTPS = SECURITY_HEADERS + [
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+]
+
+
+# Methods whose request body is never read (no request size check)
+BODYLESS_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+class SecurityMiddleware:
     """
-    Middleware to add security HTTP headers to all responses.
+    Middleware applying the security measures of the API to HTTP requests.
+    
+    In the order in which they apply to a request:
+    - Security headers: added to all responses to protect against common
+      web vulnerabilities (X-Content-Type-Options, X-Frame-Options,
+      X-XSS-Protection, Content-Security-Policy, and
+      Strict-Transport-Security behind an HTTPS proxy)
+    - Request size limit: requests whose Content-Length exceeds
+      MAX_REQUEST_SIZE are rejected with a 413 response
+    - Security logging: logs the client IP address, path and user agent of
+      each request, and the status code of error responses
     
-    Adds headers to protect against common web vulnerabilities:
-    - X-Content-Type-Options: Prevents MIME type sniffing
-    - X-Frame-Options: Prevents clickjacking
-    - X-XSS-Protection: Enables XSS filtering
-    - Strict-Transport-Security: Forces HTTPS (if enabled)
-    - Content-Security-Policy: Basic CSP policy
+    The three measures run in a single plain ASGI middleware: the request
+    headers are read in one pass and each request goes through one extra
+    layer instead of three.
     """
     
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        if ENABLE_SECURITY_HEADERS:
-            # Prevent MIME type sniffing
-            response.headers["X-Content-Type-Options"] = "nosniff"
-            
-            # Prevent clickjacking
-            response.headers["X-Frame-Options"] = "DENY"
-            
-            # Enable XSS protection
-            response.headers["X-XSS-Protection"] = "1; mode=block"
-            
-            # Basic Content Security Policy
-            # Allow same-origin and data URIs for images, scripts, styles
-            # Allow cdn.jsdelivr.net for Swagger UI resources
-            response.headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net; "
-                "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
-                "img-src 'self' data: https:; "
-                "font-src 'self' data: https://cdn.jsdelivr.net; "
-                "connect-src 'self'"
-            )
-            
-            # HSTS - Only add if HTTPS is detected
-            # In production behind a proxy, the proxy should handle this
-            # But we can add it if X-Forwarded-Proto indicates HTTPS
-            if request.headers.get("X-Forwarded-Proto") == "https":
-                response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        method = scope["method"]
+        path = scope["path"]
         
-        # Remove server information (security best practice)
-        if "server" in response.headers:
-            del response.headers["server"]
+        # Read the needed headers in a single pass over the raw headers
+        # (ASGI header names are lowercase bytes, the first occurrence wins)
+        forwarded_proto = None
+        forwarded_for = None
+        user_agent = None
+        content_length = None
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-proto" and forwarded_proto is None:
+                forwarded_proto = value
+            elif name == X_FORWARDED_FOR and forwarded_for is None:
+                forwarded_for = value
+            elif name == b"user-agent" and user_agent is None:
+                user_agent = value.decode("latin-1")
+            elif name == b"content-length" and content_length is None:
+                content_length = value
         
-        return response
-
-
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to limit the size of request bodies.
-    
-    Prevents large payload attacks by rejecting requests that exceed
-    the configured maximum size.
-    """
-    
-    async def dispatch(self, request: Request, call_next):
-        # Check Content-Length header if present
-        content_length = request.headers.get("content-length")
+        # Security headers, pre-encoded at import
+        # With ENABLE_SECURITY_HEADERS=false the response headers are left
+        # untouched and send is not wrapped at all
+        if ENABLE_SECURITY_HEADERS:
+            added_headers = SECURITY_HEADERS_HTTPS if forwarded_proto == b"https" else SECURITY_HEADERS
+            
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # The Server header is disabled in uvicorn (--no-server-header
+                    # in the Procfile and the scripts/ launchers) rather than
+                    # removed from every response
+                    message["headers"] = [*message.get("headers", ()), *added_headers]
+                await send(message)
+        else:
+            send_with_headers = send
         
-        if content_length:
+        # Request size limit (GET, HEAD and OPTIONS requests have no body
+        # that the API would read). A Content-Length with fewer characters
+        # than MAX_REQUEST_SIZE has digits cannot exceed it, so int() only
+        # runs for values of similar length.
+        if (
+            content_length
+            and len(content_length) >= MAX_REQUEST_SIZE_DIGITS
+            and method not in BODYLESS_METHODS
+        ):
             try:
                 size = int(content_length)
-                if size > MAX_REQUEST_SIZE:
-                    logger.warning(
-                        f"Request rejected: body size {size} exceeds limit {MAX_REQUEST_SIZE}. "
-                        f"IP: {request.client.host if request.client else 'unknown'}, "
-                        f"Path: {request.url.path}"
-                    )
-                    return JSONResponse(
-                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        content={
-                            "detail": f"Request body too large. Maximum size: {MAX_REQUEST_SIZE} bytes"
-                        }
-                    )
             except ValueError:
                 # Invalid content-length header, let it pass (will be handled by FastAPI)
-                pass
-        
+                size = 0
+            if size > MAX_REQUEST_SIZE:
+                client = scope.get("client")
+                logger.warning(
+                    "Request rejected: body size %s exceeds limit %s. IP: %s, Path: %s",
+                    size, MAX_REQUEST_SIZE, client[0] if client else "unknown", path
+                )
+                response = JSONResponse(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    content={
+                        "detail": f"Request body too large. Maximum size: {MAX_REQUEST_SIZE} bytes"
+                    }
+                )
+                await response(scope, receive, send_with_headers)
+                return
         # For streaming requests, we rely on FastAPI's built-in size limits
-        response = await call_next(request)
-        return response
+        
+        # Get client IP for logging (considering proxies). The leftmost
+        # X-Forwarded-For value is set by the client, so it is not used for
+        # rate limiting (see get_rate_limit_key)
+        if forwarded_for is not None:
+            client_ip = forwarded_for.split(b",", 1)[0].strip().decode("latin-1")
+        else:
+            client = scope.get("client")
+            client_ip = client[0] if client else "unknown"
+        
+        # Log request (the message is only formatted if INFO is enabled)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Request: %s %s from %s (User-Agent: %s)",
+                method, path, client_ip, user_agent if user_agent is not None else "unknown"
+            )
+        
+        async def send_and_log(message: Message) -> None:
+            # Log security-relevant responses
+            if message["type"] == "http.response.start" and message["status"] >= 400:
+                logger.warning(
+                    "Error response: %s for %s %s from %s",
+                    message["status"], method, path, client_ip
+                )
+            await send_with_headers(message)
+        
+        await self.app(scope, receive, send_and_log)
 
 
-class SecurityLoggingMiddleware(BaseHTTPMiddleware):
+class OriginSetCORSMiddleware(CORSMiddleware):
     """
-    Middleware to log security-relevant events.
+    CORS middleware checking exact origins before the origin regex.
     
-    Logs:
-    - Request IP addresses
-    - Request paths
-    - User agents
-    - Response status codes
+    Starlette's CORSMiddleware tries the regex first and then scans the list
+    of allowed origins. Pass allow_origins as a frozenset so that exact
+    origins (the common case: production domains) are a single hash lookup
+    and the regex only runs for the remaining ones.
     """
     
-    async def dispatch(self, request: Request, call_next):
-        # Get client IP (considering proxies)
-        client_ip = request.client.host if request.client else "unknown"
-        if "X-Forwarded-For" in request.headers:
-            client_ip = request.headers["X-Forwarded-For"].split(",")[0].strip()
-        
-        # Log request
-        user_agent = request.headers.get("user-agent", "unknown")
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {client_ip} "
-            f"(User-Agent: {user_agent})"
-        )
-        
-        response = await call_next(request)
-        
-        # Log security-relevant responses
-        if response.status_code >= 400:
-            logger.warning(
-                f"Error response: {response.status_code} for {request.method} {request.url.path} "
-                f"from {client_ip}"
-            )
-        
-        return response
-
+    def is_allowed_origin(self, origin: str) -> bool:
+        if origin in self.allow_origins:
+            return True
+        return super().is_allowed_origin(origin)
@@ -0,0 +1,99 @@
+"""
+Lazy access to the data processing functions of OpenChemFacts Backend.
+
+The data processing modules live under data/graph/ and pull in heavy
+dependencies (scipy, plotly). They are imported on first use through a
+module-level __getattr__ (PEP 562), so the API starts without loading them
+and later accesses are plain module attribute lookups.
+
+Example:
+    >>> from app import plotting
+    >>> ssd_data = plotting.get_ssd_data(df, "107-05-1")
+"""
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+GRAPH_DIR = Path(__file__).resolve().parent.parent / "data" / "graph"
+
+# Exposed function name -> (module name, path relative to data/graph/)
+# Some directories contain spaces ("EC10 details", "SSD comparison"), so the
+# modules are loaded from their file location instead of a dotted import path.
+_FUNCTIONS = {
+    "get_ssd_data": ("plot_ssd_curve", Path("SSD") / "plot_ssd_curve.py"),
+    "get_ec10eq_data_json": ("api_ec10eq", Path("EC10 details") / "api_ec10eq.py"),
+    "get_ssd_comparison_data": ("ssd_comparison_data", Path("SSD comparison") / "ssd_comparison_data.py"),
+}
+
+# Sibling modules imported by plain name ("from ec10eq_data import ...") by a
+# data processing module: module name -> {sibling name: path relative to
+# data/graph/}. Their directories are not added to sys.path, so the siblings
+# are loaded first and registered under their plain name.
+_SIBLINGS = {
+    "api_ec10eq": {"ec10eq_data": Path("EC10 details") / "ec10eq_data.py"},
+}
+
+__all__ = list(_FUNCTIONS)
+
+
+def _load_module(module_name: str, relative_path: Path, qualified_name: Optional[str] = None):
+    """
+    Import a data processing module from data/graph/ and register it in sys.modules.
+
+    Args:
+        module_name: Name of the module (e.g., "plot_ssd_curve")
+        relative_path: Path of the module file relative to data/graph/
+        qualified_name: Name registered in sys.modules (default: "data.graph.<module_name>")
+
+    Returns:
+        Imported module
+
+    Raises:
+        ImportError: If the module file does not exist
+    """
+    if qualified_name is None:
+        qualified_name = f"data.graph.{module_name}"
+    if qualified_name in sys.modules:
+        return sys.modules[qualified_name]
+
+    module_path = GRAPH_DIR / relative_path
+    if not module_path.exists():
+        raise ImportError(f"Data processing module not found at {module_path}")
+
+    spec = importlib.util.spec_from_file_location(qualified_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[qualified_name]
+        raise
+    return module
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a data processing function on first access (PEP 562).
+
+    The function is stored in the module globals, so this hook only runs once
+    per name.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        Requested data processing function
+
+    Raises:
+        AttributeError: If name is not a known data processing function
+    """
+    if name not in _FUNCTIONS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, relative_path = _FUNCTIONS[name]
+    for sibling_name, sibling_path in _SIBLINGS.get(module_name, {}).items():
+        _load_module(sibling_name, sibling_path, qualified_name=sibling_name)
+    func = getattr(_load_module(module_name, relative_path), name)
+    globals()[name] = func
+    return func
@@ -0,0 +1,64 @@
+"""
+Response classes for OpenChemFacts Backend API.
+
+ORJSONResponse serializes JSON with orjson, which is several times faster than
+the standard json module used by JSONResponse. It is defined here because
+fastapi.responses.ORJSONResponse is deprecated in recent FastAPI versions.
+
+StaticJSON holds a pre-serialized JSON document for endpoints whose response
+never changes.
+"""
+import hashlib
+from typing import Any
+
+import orjson
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+    
+    NumPy scalars and arrays are serialized natively and non-string dictionary
+    keys are converted to strings, like FastAPI's former ORJSONResponse.
+    NaN and infinite floats are written as null.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class StaticJSON:
+    """
+    JSON document serialized once and served with an ETag.
+    
+    Used by endpoints whose response never changes for the lifetime of the
+    process (e.g. "/" and "/api/license"): the body is encoded at import and
+    clients revalidating with If-None-Match get an empty 304 response.
+    
+    Example:
+        >>> ROOT = StaticJSON({"status": "running"})
+        >>> @app.get("/")
+        ... def root(request: Request):
+        ...     return ROOT.response(request)
+    """
+    
+    def __init__(self, content: Any):
+        self.body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()}"'
+    
+    def response(self, request: Request) -> Response:
+        """
+        Build the response for a request.
+        
+        Args:
+            request: Incoming request (checked for an If-None-Match header)
+            
+        Returns:
+            304 response if the client already has this document, otherwise
+            a 200 response with the pre-serialized body
+        """
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers={"ETag": self.etag})
+        return Response(content=self.body, media_type="application/json", headers={"ETag": self.etag})
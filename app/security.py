@@ -7,7 +7,6 @@ This module provides:
 """
 import os
 from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi import Request
 
@@ -19,15 +18,29 @@ RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
 RATE_LIMIT_PLOT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PLOT_PER_MINUTE", "10"))
 RATE_LIMIT_HEALTH_PER_MINUTE = int(os.getenv("RATE_LIMIT_HEALTH_PER_MINUTE", "120"))
 
-# Create rate limiter instance
-limiter = Limiter(key_func=get_remote_address)
+# Raw (lowercase, bytes) name of the header carrying the client IP behind a proxy
+# (only logged: it is set by the client, see get_rate_limit_key)
+X_FORWARDED_FOR = b"x-forwarded-for"
 
+# Storage of the rate limit counters. The default in-memory storage counts per
+# process: with several workers or containers, point all of them to the same
+# Redis instance (e.g. RATE_LIMIT_STORAGE_URI=redis://host:6379, requires the
+# redis package) so that the limits apply to the whole deployment. Counters are
+# then updated atomically on the Redis server.
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
 
 def get_rate_limit_key(request: Request) -> str:
     """
     Get rate limit key based on client IP address.
     
-    Considers X-Forwarded-For header for requests behind proxies.
+    Uses the address of the connected client. Behind the Scalingo router,
+    uvicorn (--proxy-headers, see the Procfile) replaces it with an address
+    from X-Forwarded-For, but only for requests coming from a proxy listed in
+    FORWARDED_ALLOW_IPS. It reads the header from the right and keeps the
+    first address that is not a trusted proxy: the one the router appended.
+    FORWARDED_ALLOW_IPS must list the router addresses, never "*": every peer
+    would then be trusted and uvicorn would keep the leftmost value, which
+    the client sets and could change to get a new bucket on every request.
     
     Args:
         request: FastAPI request object
@@ -35,72 +48,53 @@ def get_rate_limit_key(request: Request) -> str:
     Returns:
         IP address string for rate limiting
     """
-    # Check for forwarded IP (when behind proxy/load balancer)
-    if "X-Forwarded-For" in request.headers:
-        # Take the first IP in the chain
-        forwarded_ips = request.headers["X-Forwarded-For"].split(",")
-        return forwarded_ips[0].strip()
-    
-    # Fall back to direct client IP
     if request.client:
         return request.client.host
     
     return "unknown"
 
 
-# Update limiter key function
-limiter.key_func = get_rate_limit_key
+# Create rate limiter instance
+# The key function must be passed here: slowapi reads it from a private
+# attribute, so assigning limiter.key_func afterwards has no effect
+limiter = Limiter(key_func=get_rate_limit_key, storage_uri=RATE_LIMIT_STORAGE_URI)
 
 
-def get_rate_limit_for_endpoint(path: str) -> str:
-    """
-    Get appropriate rate limit for an endpoint based on its path.
-    
-    Args:
-        path: Request path
-        
-    Returns:
-        Rate limit string (e.g., "60/minute")
-    """
-    if not RATE_LIMIT_ENABLED:
-        return None
-    
-    # Health and root endpoints: more lenient
-    if path in ["/health", "/", "/docs", "/redoc", "/openapi.json"]:
-        return f"{RATE_LIMIT_HEALTH_PER_MINUTE}/minute"
-    
-    # Plot/computation endpoints: stricter limits
-    if "/plot/" in path:
-        return f"{RATE_LIMIT_PLOT_PER_MINUTE}/minute"
-    
-    # Default rate limit for other endpoints
-    return f"{RATE_LIMIT_PER_MINUTE}/minute"
+# Rate limit strings, built once at import
+DATA_RATE_LIMIT = f"{RATE_LIMIT_PER_MINUTE}/minute"
+PLOT_RATE_LIMIT = f"{RATE_LIMIT_PLOT_PER_MINUTE}/minute"
+HEALTH_RATE_LIMIT = f"{RATE_LIMIT_HEALTH_PER_MINUTE}/minute"
+
+
+def _no_rate_limit(func):
+    """No-op decorator used when rate limiting is disabled."""
+    return func
+
+
+# Rate limit decorators, built once at import
+_DATA_RATE_LIMIT_DECORATOR = limiter.limit(DATA_RATE_LIMIT) if RATE_LIMIT_ENABLED else _no_rate_limit
+_PLOT_RATE_LIMIT_DECORATOR = limiter.limit(PLOT_RATE_LIMIT) if RATE_LIMIT_ENABLED else _no_rate_limit
+_HEALTH_RATE_LIMIT_DECORATOR = limiter.limit(HEALTH_RATE_LIMIT) if RATE_LIMIT_ENABLED else _no_rate_limit
 
 
 # Rate limit decorators for different endpoint types
 def rate_limit_data():
     """Rate limit decorator for data endpoints (default limit)."""
-    if not RATE_LIMIT_ENABLED:
-        return lambda f: f  # No-op decorator if rate limiting is disabled
-    return limiter.limit(f"{RATE_LIMIT_PER_MINUTE}/minute")
+    return _DATA_RATE_LIMIT_DECORATOR
 
 
 def rate_limit_plot():
     """Rate limit decorator for plot/computation endpoints (stricter limit)."""
-    if not RATE_LIMIT_ENABLED:
-        return lambda f: f  # No-op decorator if rate limiting is disabled
-    return limiter.limit(f"{RATE_LIMIT_PLOT_PER_MINUTE}/minute")
+    return _PLOT_RATE_LIMIT_DECORATOR
 
 
 def rate_limit_health():
     """Rate limit decorator for health/root endpoints (more lenient limit)."""
-    if not RATE_LIMIT_ENABLED:
-        return lambda f: f  # No-op decorator if rate limiting is disabled
-    return limiter.limit(f"{RATE_LIMIT_HEALTH_PER_MINUTE}/minute")
+    return _HEALTH_RATE_LIMIT_DECORATOR
 
 
 def apply_rate_limit(limit_str: str):
     """Apply rate limiting decorator if enabled."""
     if not RATE_LIMIT_ENABLED:
-        return lambda f: f  # No-op decorator if rate limiting is disabled
+        return _no_rate_limit
     return limiter.limit(limit_str)
@@ -9,24 +9,109 @@ Pour Scalingo:
     Ajouter dans Procfile: web: uvicorn api_ec10eq_backend:app --host 0.0.0.0 --port $PORT
 """
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List, Dict, Any
-import sys
-from pathlib import Path
+from typing import Optional, List, Any, Iterator, Tuple
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import asyncio
+import io
+import logging
+import time
 import os
+import numpy as np
+import orjson
 import polars as pl
 
+# Shared loader and JSON formatting (sibling modules, importable because this
+# API is started from its own directory)
+from ec10eq_data import DATA_PATH, load_data, load_and_prepare_data, select_endpoints
+from api_ec10eq import get_ec10eq_data_json
+
 # Configuration
-current_dir = Path(__file__).parent
-DATA_PATH = os.getenv(
-    "EC10EQ_DATA_PATH",
-    str(current_dir / "results_ecotox_EC10_list_per_species.parquet")
-)
+# Cache des graphiques déjà encodés en JSON (nombre d'entrées, durée de vie en secondes)
+PLOT_CACHE_SIZE = int(os.getenv("EC10EQ_PLOT_CACHE_SIZE", "256"))
+PLOT_CACHE_TTL = float(os.getenv("EC10EQ_PLOT_CACHE_TTL", "600"))
+
+# Type de contenu Arrow IPC (format stream) négocié via l'en-tête Accept
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Nombre d'endpoints encodés par bloc en mode streaming NDJSON
+NDJSON_CHUNK_ROWS = 1000
+
+# (cas, color_by, data file mtime) -> (expiry time, encoded Plotly JSON)
+_plot_cache: "OrderedDict[Tuple[str, str, Optional[int]], Tuple[float, bytes]]" = OrderedDict()
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the values orjson does not handle natively (object NumPy arrays, e.g. Plotly customdata)."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError
+
+
+def _orjson_dumps(content: Any) -> bytes:
+    """Encode content to JSON bytes with orjson (NumPy arrays and scalars included)."""
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (NumPy arrays and scalars included)."""
+    
+    def render(self, content: Any) -> bytes:
+        return _orjson_dumps(content)
+
+
+def _data_mtime_ns() -> Optional[int]:
+    """Modification time of the data file (None if it does not exist)."""
+    try:
+        return os.stat(DATA_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+logger = logging.getLogger(__name__)
+
+
+def prewarm_data() -> None:
+    """
+    Load the data file into memory before the first request.
+    
+    The kernel is first advised to read the whole file ahead (where
+    posix_fadvise is available), then the parquet file is decoded once so
+    that the shared cache of ec10eq_data is populated.
+    
+    Raises:
+        FileNotFoundError: If the data file does not exist
+    """
+    if hasattr(os, "posix_fadvise"):
+        fd = os.open(DATA_PATH, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    load_data()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pré-charger les données au démarrage (une erreur est signalée par /health)."""
+    try:
+        await asyncio.to_thread(prewarm_data)
+    except Exception as e:
+        logger.error("Failed to preload EC10eq data: %s", e)
+    yield
+
 
 # Initialiser l'application FastAPI
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title="EC10eq by Trophic Group and Species API",
     description="API RESTful pour récupérer les données EC10eq par groupe trophique et espèce",
     version="1.0.0",
@@ -44,127 +129,54 @@ app.add_middleware(
 )
 
 
-def load_and_prepare_data(cas_number: str, data_path: Optional[str] = None) -> pl.DataFrame:
+def get_ec10eq_data_arrow(cas_number: str, data_path: Optional[str] = None) -> bytes:
     """
-    Load parquet file and prepare data for a specific CAS number.
+    Encode the EC10eq endpoints of a CAS number as an Arrow IPC stream.
+    
+    The table has the columns of the 'simple' format, one row per endpoint.
     
     Args:
         cas_number: CAS number to filter by
-        data_path: Optional path to the data file. If None, uses DATA_PATH from environment or default.
+        data_path: Optional path to the data file
         
     Returns:
-        DataFrame with exploded Details containing test_id, year, author, EC10eq
+        Arrow IPC stream bytes
+        
+    Raises:
+        ValueError: If CAS number not found
+        FileNotFoundError: If data file not found
     """
-    file_path = data_path or DATA_PATH
-    
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Data file not found: {file_path}")
-    
-    # Load the parquet file
-    df = pl.read_parquet(file_path)
-    
-    # Filter by CAS number
-    df_filtered = df.filter(pl.col("cas_number") == cas_number)
-    
-    if df_filtered.is_empty():
-        raise ValueError(f"No data found for CAS number: {cas_number}")
-    
-    # Explode Details to get individual endpoint records
-    df_exploded = df_filtered.explode("Details")
-    
-    # Extract fields from Details struct
-    df_exploded = df_exploded.with_columns([
-        pl.col("Details").struct.field("test_id").alias("test_id"),
-        pl.col("Details").struct.field("year").alias("year"),
-        pl.col("Details").struct.field("author").alias("author"),
-        pl.col("Details").struct.field("EC10eq").alias("EC10eq")
-    ])
-    
-    # Drop the Details column as we've extracted all fields
-    df_exploded = df_exploded.drop("Details")
-    
-    # Rename column for clarity
-    df_exploded = df_exploded.rename({
-        "ecotox_group_unepsetacjrc2018": "trophic_group"
-    })
-    
-    return df_exploded
+    buffer = io.BytesIO()
+    select_endpoints(load_and_prepare_data(cas_number, data_path)).write_ipc_stream(buffer)
+    return buffer.getvalue()
 
 
-def get_ec10eq_data_json(cas_number: str, data_path: Optional[str] = None, format: str = "detailed") -> Dict[str, Any]:
+def iter_ec10eq_ndjson(cas_number: str, data_path: Optional[str] = None) -> Iterator[bytes]:
     """
-    Get EC10eq data for a CAS number in JSON format.
+    Encode the EC10eq endpoints of a CAS number as newline-delimited JSON.
+    
+    Each line is one endpoint with the fields of the 'simple' format. The
+    data is loaded (and a missing CAS number reported) before the first
+    chunk is produced, then encoded NDJSON_CHUNK_ROWS endpoints at a time.
     
     Args:
         cas_number: CAS number to filter by
-        data_path: Optional path to the data file. If None, uses DATA_PATH from environment or default.
-        format: Format of output - 'detailed' (default) or 'simple'
+        data_path: Optional path to the data file
         
     Returns:
-        Dictionary containing EC10eq data organized by trophic group and species
+        Iterator over chunks of NDJSON bytes
+        
+    Raises:
+        ValueError: If CAS number not found
+        FileNotFoundError: If data file not found
     """
-    df = load_and_prepare_data(cas_number, data_path)
+    df = select_endpoints(load_and_prepare_data(cas_number, data_path))
     
-    # Get chemical name
-    chemical_name = None
-    if "chemical_name" in df.columns:
-        chemical_name = df["chemical_name"][0]
+    def generate() -> Iterator[bytes]:
+        for chunk in df.iter_slices(n_rows=NDJSON_CHUNK_ROWS):
+            yield b"".join(orjson.dumps(row) + b"\n" for row in chunk.iter_rows(named=True))
     
-    # Convert to pandas for easier JSON serialization
-    df_pd = df.to_pandas()
-    
-    # Handle missing values
-    df_pd["year"] = df_pd["year"].fillna(0).astype(int)
-    df_pd["author"] = df_pd["author"].fillna("Unknown")
-    df_pd["test_id"] = df_pd["test_id"].fillna(0).astype(int)
-    
-    if format == "simple":
-        # Simple format: just the endpoints
-        endpoints = []
-        for _, row in df_pd.iterrows():
-            endpoints.append({
-                "trophic_group": row["trophic_group"],
-                "species": row["species_common_name"],
-                "EC10eq": float(row["EC10eq"]),
-                "test_id": int(row["test_id"]),
-                "year": int(row["year"]),
-                "author": row["author"]
-            })
-        
-        return {
-            "cas": cas_number,
-            "chemical_name": chemical_name,
-            "endpoints": endpoints
-        }
-    else:
-        # Detailed format: organized by trophic group and species
-        result = {
-            "cas": cas_number,
-            "chemical_name": chemical_name,
-            "trophic_groups": {}
-        }
-        
-        # Group by trophic group
-        for trophic_group in sorted(df_pd["trophic_group"].unique()):
-            df_group = df_pd[df_pd["trophic_group"] == trophic_group]
-            result["trophic_groups"][trophic_group] = {}
-            
-            # Group by species
-            for species in sorted(df_group["species_common_name"].unique()):
-                df_species = df_group[df_group["species_common_name"] == species]
-                endpoints = []
-                
-                for _, row in df_species.iterrows():
-                    endpoints.append({
-                        "EC10eq": float(row["EC10eq"]),
-                        "test_id": int(row["test_id"]),
-                        "year": int(row["year"]),
-                        "author": row["author"]
-                    })
-                
-                result["trophic_groups"][trophic_group][species] = endpoints
-        
-        return result
+    return generate()
 
 
 @app.get("/")
@@ -185,8 +197,10 @@ async def root():
 
 @app.get("/ec10eq/data")
 async def get_ec10eq_data(
+    request: Request,
     cas: str = Query(..., description="Numéro CAS du produit chimique (ex: 60-51-5)"),
-    format: Optional[str] = Query("detailed", description="Format de sortie: 'detailed' ou 'simple'")
+    format: Optional[str] = Query("detailed", description="Format de sortie: 'detailed' ou 'simple'"),
+    stream: bool = Query(False, description="Streamer les endpoints en NDJSON (un objet JSON par ligne)")
 ):
     """
     Récupère les données EC10eq pour un CAS donné.
@@ -194,9 +208,13 @@ async def get_ec10eq_data(
     **Paramètres:**
     - `cas`: Numéro CAS du produit chimique (requis)
     - `format`: Format de sortie - 'detailed' (par défaut) ou 'simple'
+    - `stream`: Si `true`, streame les endpoints en NDJSON (`application/x-ndjson`),
+      une ligne par endpoint avec les champs du format 'simple' (`format` est ignoré)
     
     **Retour:**
     - JSON avec les données EC10eq organisées par groupe trophique et espèce
+    - Si l'en-tête `Accept` contient `application/vnd.apache.arrow.stream`, la table des
+      endpoints (colonnes du format 'simple') au format Arrow IPC stream
     
     **Exemple:**
     ```
@@ -204,8 +222,14 @@ async def get_ec10eq_data(
     ```
     """
     try:
-        result = get_ec10eq_data_json(cas, format=format)
-        return JSONResponse(content=result)
+        if ARROW_STREAM_MEDIA_TYPE in request.headers.get("accept", ""):
+            return Response(content=get_ec10eq_data_arrow(cas), media_type=ARROW_STREAM_MEDIA_TYPE)
+        
+        if stream:
+            return StreamingResponse(iter_ec10eq_ndjson(cas), media_type="application/x-ndjson")
+        
+        result = get_ec10eq_data_json(cas, output_format=format)
+        return ORJSONResponse(content=result)
             
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -232,45 +256,61 @@ async def get_ec10eq_stats(
     - JSON avec les statistiques (nombre de groupes trophiques, espèces, endpoints, etc.)
     """
     try:
-        df = load_and_prepare_data(cas)
+        # Missing test_id/year/author stay null: they are not counted as
+        # year 0 in the year range
+        df = load_and_prepare_data(cas, fill_missing=False)
         
         # Get chemical name
-        chemical_name = None
-        if "chemical_name" in df.columns:
-            chemical_name = df["chemical_name"][0]
+        chemical_name = df.get_column("chemical_name").first() if "chemical_name" in df.columns else None
+        
+        # Calculate statistics (all aggregations in a single Polars select)
+        agg = df.select([
+            pl.len().alias("total_endpoints"),
+            pl.col("trophic_group").n_unique().alias("trophic_groups_count"),
+            pl.col("trophic_group").unique().sort().implode().alias("trophic_groups_list"),
+            pl.col("species_common_name").n_unique().alias("species_count"),
+            pl.col("species_common_name").unique().sort().implode().alias("species_list"),
+            pl.col("test_id").n_unique().alias("tests_count"),
+            pl.col("year").min().alias("year_min"),
+            pl.col("year").max().alias("year_max"),
+            pl.col("author").n_unique().alias("authors_count"),
+            pl.col("EC10eq").min().alias("ec10eq_min"),
+            pl.col("EC10eq").max().alias("ec10eq_max"),
+            pl.col("EC10eq").mean().alias("ec10eq_mean"),
+            pl.col("EC10eq").median().alias("ec10eq_median")
+        ]).row(0, named=True)
         
-        # Calculate statistics
         stats = {
             "cas": cas,
             "chemical_name": chemical_name,
-            "total_endpoints": len(df),
+            "total_endpoints": agg["total_endpoints"],
             "trophic_groups": {
-                "count": df["trophic_group"].n_unique(),
-                "list": sorted(df["trophic_group"].unique().to_list())
+                "count": agg["trophic_groups_count"],
+                "list": agg["trophic_groups_list"]
             },
             "species": {
-                "count": df["species_common_name"].nunique(),
-                "list": sorted(df["species_common_name"].unique().to_list())
+                "count": agg["species_count"],
+                "list": agg["species_list"]
             },
             "tests": {
-                "count": df["test_id"].n_unique()
+                "count": agg["tests_count"]
             },
             "year": {
-                "min": int(df["year"].min()),
-                "max": int(df["year"].max())
+                "min": int(agg["year_min"]),
+                "max": int(agg["year_max"])
             },
             "authors": {
-                "count": df["author"].n_unique()
+                "count": agg["authors_count"]
             },
             "ec10eq": {
-                "min": float(df["EC10eq"].min()),
-                "max": float(df["EC10eq"].max()),
-                "mean": float(df["EC10eq"].mean()),
-                "median": float(df["EC10eq"].median())
+                "min": float(agg["ec10eq_min"]),
+                "max": float(agg["ec10eq_max"]),
+                "mean": float(agg["ec10eq_mean"]),
+                "median": float(agg["ec10eq_median"])
             }
         }
         
-        return JSONResponse(content=stats)
+        return ORJSONResponse(content=stats)
         
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -308,26 +348,38 @@ async def get_ec10eq_plot_json(
     ```
     """
     try:
+        # Validate color_by
+        if color_by not in ["trophic_group", "year", "author"]:
+            color_by = "trophic_group"
+        
+        # Le graphique ne dépend que de (cas, color_by) et du fichier de données :
+        # renvoyer directement le JSON déjà encodé s'il est en cache
+        key = (cas, color_by, _data_mtime_ns())
+        now = time.monotonic()
+        cached = _plot_cache.get(key)
+        if cached is not None and now < cached[0]:
+            _plot_cache.move_to_end(key)
+            return Response(content=cached[1], media_type="application/json")
+        
         # Import the plotting function
-        sys.path.insert(0, str(current_dir))
         from plot_ec10eq_by_trophic_species import create_ec10eq_plot
         
         df = load_and_prepare_data(cas)
         
         # Get chemical name
-        chemical_name = None
-        if "chemical_name" in df.columns:
-            chemical_name = df["chemical_name"][0]
-        
-        # Validate color_by
-        if color_by not in ["trophic_group", "year", "author"]:
-            color_by = "trophic_group"
+        chemical_name = df.get_column("chemical_name").first() if "chemical_name" in df.columns else None
         
         # Create plot
         fig = create_ec10eq_plot(df, cas, chemical_name, log_scale=True, color_by=color_by)
         
-        # Return Plotly JSON structure
-        return JSONResponse(content=fig.to_dict())
+        # Encode the Plotly JSON structure once and cache it
+        payload = _orjson_dumps(fig.to_dict())
+        _plot_cache[key] = (now + PLOT_CACHE_TTL, payload)
+        _plot_cache.move_to_end(key)
+        if len(_plot_cache) > PLOT_CACHE_SIZE:
+            _plot_cache.popitem(last=False)
+        
+        return Response(content=payload, media_type="application/json")
         
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
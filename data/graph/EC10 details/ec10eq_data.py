@@ -0,0 +1,138 @@
+"""
+Shared loading of the EC10eq data by trophic group and species.
+
+The parquet file is decoded once per process into one row per endpoint,
+and the same cached table serves app/api.py (through api_ec10eq.py), the
+standalone EC10eq API (EC10eq_details.py) and the plotting script
+(plot_ec10eq_by_trophic_species.py), along with the column selection of the
+'simple' endpoint format.
+"""
+
+from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+import os
+import polars as pl
+
+# Default data path (can be overridden via data_path parameter)
+current_dir = Path(__file__).parent
+DATA_PATH = os.getenv(
+    "EC10EQ_DATA_PATH",
+    str(current_dir / "results_ecotox_EC10_list_per_species.parquet")
+)
+
+
+@lru_cache(maxsize=4)
+def _load_parquet(file_path: str, mtime_ns: int) -> pl.DataFrame:
+    """
+    Load the parquet file with Details exploded into one row per endpoint.
+    
+    The result is cached per (file_path, mtime_ns), so that the file is only
+    read and decoded once per process, and again if it is modified.
+    
+    Args:
+        file_path: Path to the parquet file
+        mtime_ns: Modification time of the file (part of the cache key)
+        
+    Returns:
+        DataFrame with exploded Details containing test_id, year, author, EC10eq
+        (missing values kept as null, see load_and_prepare_data)
+    """
+    # Single lazy query: the explode, field extraction and renaming run in
+    # the same plan as the parquet scan, without intermediate DataFrames
+    return (
+        pl.scan_parquet(file_path)
+        # Explode Details to get individual endpoint records
+        .explode("Details")
+        # Extract fields from Details struct
+        .with_columns([
+            pl.col("Details").struct.field("test_id").cast(pl.Int64).alias("test_id"),
+            pl.col("Details").struct.field("year").cast(pl.Int64).alias("year"),
+            pl.col("Details").struct.field("author").alias("author"),
+            pl.col("Details").struct.field("EC10eq").cast(pl.Float64).alias("EC10eq")
+        ])
+        # Drop the Details column as we've extracted all fields
+        .drop("Details")
+        # Rename column for clarity
+        .rename({
+            "ecotox_group_unepsetacjrc2018": "trophic_group"
+        })
+        .collect()
+    )
+
+
+def load_data(data_path: Optional[str] = None) -> pl.DataFrame:
+    """
+    Load the EC10eq endpoints of all CAS numbers.
+    
+    The file is decoded once per file version (the modification time is part
+    of the cache key) and shared by every caller in the process.
+    
+    Args:
+        data_path: Optional path to the data file. If None, uses DATA_PATH from environment or default.
+        
+    Returns:
+        DataFrame with exploded Details containing test_id, year, author, EC10eq
+        
+    Raises:
+        FileNotFoundError: If data file not found
+    """
+    file_path = data_path or DATA_PATH
+    
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Data file not found: {file_path}")
+    
+    return _load_parquet(file_path, os.stat(file_path).st_mtime_ns)
+
+
+def load_and_prepare_data(
+    cas_number: str,
+    data_path: Optional[str] = None,
+    fill_missing: bool = True
+) -> pl.DataFrame:
+    """
+    Load parquet file and prepare data for a specific CAS number.
+    
+    Args:
+        cas_number: CAS number to filter by
+        data_path: Optional path to the data file. If None, uses DATA_PATH from environment or default.
+        fill_missing: If True (JSON and plot outputs), missing test_id and year
+            are set to 0 and missing author to "Unknown". If False (statistics),
+            they are kept as null so that they do not count as year 0.
+        
+    Returns:
+        DataFrame with exploded Details containing test_id, year, author, EC10eq
+        
+    Raises:
+        FileNotFoundError: If data file not found
+        ValueError: If CAS number not found
+    """
+    df = load_data(data_path)
+    
+    # Filter by CAS number
+    df_filtered = df.filter(pl.col("cas_number") == cas_number)
+    
+    if df_filtered.is_empty():
+        raise ValueError(f"No data found for CAS number: {cas_number}")
+    
+    if fill_missing:
+        # Handle missing values on the rows of this CAS number only
+        df_filtered = df_filtered.with_columns([
+            pl.col("test_id").fill_null(0),
+            pl.col("year").fill_null(0),
+            pl.col("author").fill_null("Unknown")
+        ])
+    
+    return df_filtered
+
+
+def select_endpoints(df: pl.DataFrame) -> pl.DataFrame:
+    """Select the endpoint columns of the 'simple' format (one row per endpoint)."""
+    return df.select([
+        "trophic_group",
+        pl.col("species_common_name").alias("species"),
+        "EC10eq",
+        "test_id",
+        "year",
+        "author"
+    ])
@@ -5,56 +5,14 @@ This script creates an interactive Plotly graph showing EC10eq values grouped by
 trophic_group (ecotox_group_unepsetacjrc2018) and species_common_name.
 """
 
+import numpy as np
 import polars as pl
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import sys
 from typing import Optional
 
-
-def load_and_prepare_data(
-    file_path: str,
-    cas_number: str
-) -> pl.DataFrame:
-    """
-    Load parquet file and prepare data for a specific CAS number.
-    
-    Args:
-        file_path: Path to the parquet file
-        cas_number: CAS number to filter by
-        
-    Returns:
-        DataFrame with exploded Details containing test_id, year, author, EC10eq
-    """
-    # Load the parquet file
-    df = pl.read_parquet(file_path)
-    
-    # Filter by CAS number
-    df_filtered = df.filter(pl.col("cas_number") == cas_number)
-    
-    if df_filtered.is_empty():
-        raise ValueError(f"No data found for CAS number: {cas_number}")
-    
-    # Explode Details to get individual endpoint records
-    df_exploded = df_filtered.explode("Details")
-    
-    # Extract fields from Details struct
-    df_exploded = df_exploded.with_columns([
-        pl.col("Details").struct.field("test_id").alias("test_id"),
-        pl.col("Details").struct.field("year").alias("year"),
-        pl.col("Details").struct.field("author").alias("author"),
-        pl.col("Details").struct.field("EC10eq").alias("EC10eq")
-    ])
-    
-    # Drop the Details column as we've extracted all fields
-    df_exploded = df_exploded.drop("Details")
-    
-    # Rename column for clarity
-    df_exploded = df_exploded.rename({
-        "ecotox_group_unepsetacjrc2018": "trophic_group"
-    })
-    
-    return df_exploded
+from ec10eq_data import load_and_prepare_data
 
 
 def create_ec10eq_plot(
@@ -69,6 +27,7 @@ def create_ec10eq_plot(
     
     Args:
         df: DataFrame with EC10eq, trophic_group, species_common_name, test_id, year, author
+            (as returned by load_and_prepare_data, missing values already filled)
         cas_number: CAS number for the title
         chemical_name: Optional chemical name for the title
         log_scale: Whether to use logarithmic scale for y-axis
@@ -77,16 +36,16 @@ def create_ec10eq_plot(
     Returns:
         Plotly Figure object
     """
-    # Convert to pandas for easier plotting with Plotly
-    df_pd = df.to_pandas()
-    
-    # Handle missing values
-    df_pd["year"] = df_pd["year"].fillna(0).astype(int)
-    df_pd["author"] = df_pd["author"].fillna("Unknown")
-    df_pd["test_id"] = df_pd["test_id"].fillna(0).astype(int)
+    # One row per (trophic group, species), sorted by trophic group then
+    # species, holding the values of its endpoints as lists (in row order)
+    grouped = (
+        df.group_by(["trophic_group", "species_common_name"], maintain_order=True)
+        .agg(["EC10eq", "test_id", "year", "author"])
+        .sort(["trophic_group", "species_common_name"])
+    )
     
     # Get unique trophic groups and species
-    trophic_groups = sorted(df_pd["trophic_group"].unique())
+    trophic_groups = grouped["trophic_group"].unique(maintain_order=True).to_list()
     
     # Create color palette for trophic groups
     colors = {
@@ -112,140 +71,87 @@ def create_ec10eq_plot(
         "annelids": "hourglass",
     }
     
-    # Create a combined label: "trophic_group - species" for better organization
-    df_pd["trophic_species"] = df_pd["trophic_group"] + " - " + df_pd["species_common_name"]
+    # Combined labels "trophic_group - species", in plotting order
+    unique_combinations = [
+        f"{trophic_group} - {species}"
+        for trophic_group, species in grouped.select(["trophic_group", "species_common_name"]).iter_rows()
+    ]
     
-    # Sort by trophic group, then by species
-    df_pd = df_pd.sort_values(["trophic_group", "species_common_name"])
-    
-    # Get unique trophic_species combinations
-    unique_combinations = df_pd["trophic_species"].unique()
+    if color_by not in ("trophic_group", "year"):  # color_by == "author" or default
+        # Color by author - use distinct colors for different authors
+        authors = df["author"].unique().sort().to_list()
+        import plotly.express as px
+        author_colors = px.colors.qualitative.Set3
+        # Map authors to colors (once for all traces)
+        author_to_color = {auth: author_colors[i % len(author_colors)]
+                           for i, auth in enumerate(authors)}
     
     # Create figure
     fig = go.Figure()
     
-    # Add traces based on color_by parameter
-    if color_by == "trophic_group":
-        # Original behavior: color by trophic group
-        for trophic_group in trophic_groups:
-            df_group = df_pd[df_pd["trophic_group"] == trophic_group]
-            
-            # Group by species within this trophic group
-            for species in sorted(df_group["species_common_name"].unique()):
-                df_species = df_group[df_group["species_common_name"] == species]
-                label = f"{trophic_group} - {species}"
-                
-                # Create a trace for this species
-                fig.add_trace(
-                    go.Scatter(
-                        x=[label] * len(df_species),
-                        y=df_species["EC10eq"],
-                        mode="markers",
-                        name=trophic_group.capitalize(),
-                        marker=dict(
-                            color=colors.get(trophic_group, "#000000"),
-                            symbol=symbols.get(trophic_group, "circle"),
-                            size=10,
-                            opacity=0.7,
-                            line=dict(width=1, color="white")
-                        ),
-                        customdata=df_species[["test_id", "year", "author"]].values,
-                        hovertemplate=(
-                            "<b>EC10eq:</b> %{y:.4f} mg/L<br>"
-                            "<b>Test ID:</b> %{customdata[0]}<br>"
-                            "<b>Year:</b> %{customdata[1]}<br>"
-                            "<b>Author:</b> %{customdata[2]}<br>"
-                            "<extra></extra>"
-                        ),
-                        legendgroup=trophic_group,
-                        showlegend=(species == sorted(df_group["species_common_name"].unique())[0])
-                    )
-                )
-    elif color_by == "year":
-        # Color by year - use a continuous color scale
-        for trophic_group in trophic_groups:
-            df_group = df_pd[df_pd["trophic_group"] == trophic_group]
-            
-            for species in sorted(df_group["species_common_name"].unique()):
-                df_species = df_group[df_group["species_common_name"] == species]
-                label = f"{trophic_group} - {species}"
-                
-                fig.add_trace(
-                    go.Scatter(
-                        x=[label] * len(df_species),
-                        y=df_species["EC10eq"],
-                        mode="markers",
-                        name=trophic_group.capitalize(),
-                        marker=dict(
-                            color=df_species["year"],
-                            colorscale="Viridis",
-                            symbol=symbols.get(trophic_group, "circle"),
-                            size=10,
-                            opacity=0.7,
-                            line=dict(width=1, color="white"),
-                            colorbar=dict(title="Year", x=1.15) if species == sorted(df_group["species_common_name"].unique())[0] else None,
-                            showscale=(species == sorted(df_group["species_common_name"].unique())[0] and trophic_group == trophic_groups[0])
-                        ),
-                        customdata=df_species[["test_id", "year", "author"]].values,
-                        hovertemplate=(
-                            "<b>EC10eq:</b> %{y:.4f} mg/L<br>"
-                            "<b>Test ID:</b> %{customdata[0]}<br>"
-                            "<b>Year:</b> %{customdata[1]}<br>"
-                            "<b>Author:</b> %{customdata[2]}<br>"
-                            "<extra></extra>"
-                        ),
-                        legendgroup=trophic_group,
-                        showlegend=(species == sorted(df_group["species_common_name"].unique())[0])
-                    )
-                )
-    else:  # color_by == "author" or default
-        # Color by author - use distinct colors for different authors
-        authors = sorted(df_pd["author"].unique())
-        import plotly.express as px
-        author_colors = px.colors.qualitative.Set3
+    # One trace per species, species of a trophic group being consecutive
+    previous_group = None
+    for trophic_group, species, ec10eq, test_ids, years, species_authors in grouped.iter_rows():
+        # The legend (and color scale) is only shown for the first species of a group
+        first_species = trophic_group != previous_group
+        previous_group = trophic_group
+        label = f"{trophic_group} - {species}"
+        
+        if color_by == "trophic_group":
+            # Original behavior: color by trophic group
+            marker = dict(
+                color=colors.get(trophic_group, "#000000"),
+                symbol=symbols.get(trophic_group, "circle"),
+                size=10,
+                opacity=0.7,
+                line=dict(width=1, color="white")
+            )
+        elif color_by == "year":
+            # Color by year - use a continuous color scale
+            marker = dict(
+                color=np.array(years),
+                colorscale="Viridis",
+                symbol=symbols.get(trophic_group, "circle"),
+                size=10,
+                opacity=0.7,
+                line=dict(width=1, color="white"),
+                colorbar=dict(title="Year", x=1.15) if first_species else None,
+                showscale=(first_species and trophic_group == trophic_groups[0])
+            )
+        else:
+            marker = dict(
+                color=[author_to_color.get(auth, "#000000") for auth in species_authors],
+                symbol=symbols.get(trophic_group, "circle"),
+                size=10,
+                opacity=0.7,
+                line=dict(width=1, color="white")
+            )
         
-        for trophic_group in trophic_groups:
-            df_group = df_pd[df_pd["trophic_group"] == trophic_group]
-            
-            for species in sorted(df_group["species_common_name"].unique()):
-                df_species = df_group[df_group["species_common_name"] == species]
-                label = f"{trophic_group} - {species}"
-                
-                # Map authors to colors
-                author_to_color = {auth: author_colors[i % len(author_colors)] 
-                                 for i, auth in enumerate(authors)}
-                marker_colors = [author_to_color.get(auth, "#000000") for auth in df_species["author"]]
-                
-                fig.add_trace(
-                    go.Scatter(
-                        x=[label] * len(df_species),
-                        y=df_species["EC10eq"],
-                        mode="markers",
-                        name=trophic_group.capitalize(),
-                        marker=dict(
-                            color=marker_colors,
-                            symbol=symbols.get(trophic_group, "circle"),
-                            size=10,
-                            opacity=0.7,
-                            line=dict(width=1, color="white")
-                        ),
-                        customdata=df_species[["test_id", "year", "author"]].values,
-                        hovertemplate=(
-                            "<b>EC10eq:</b> %{y:.4f} mg/L<br>"
-                            "<b>Test ID:</b> %{customdata[0]}<br>"
-                            "<b>Year:</b> %{customdata[1]}<br>"
-                            "<b>Author:</b> %{customdata[2]}<br>"
-                            "<extra></extra>"
-                        ),
-                        legendgroup=trophic_group,
-                        showlegend=(species == sorted(df_group["species_common_name"].unique())[0])
-                    )
-                )
+        # Create a trace for this species
+        fig.add_trace(
+            go.Scatter(
+                x=[label] * len(ec10eq),
+                y=np.array(ec10eq),
+                mode="markers",
+                name=trophic_group.capitalize(),
+                marker=marker,
+                customdata=[list(row) for row in zip(test_ids, years, species_authors)],
+                hovertemplate=(
+                    "<b>EC10eq:</b> %{y:.4f} mg/L<br>"
+                    "<b>Test ID:</b> %{customdata[0]}<br>"
+                    "<b>Year:</b> %{customdata[1]}<br>"
+                    "<b>Author:</b> %{customdata[2]}<br>"
+                    "<extra></extra>"
+                ),
+                legendgroup=trophic_group,
+                showlegend=first_species
+            )
+        )
     
     # Calculate statistics for title
     num_trophic_groups = len(trophic_groups)
-    num_species = df_pd["species_common_name"].nunique()
-    num_endpoints = len(df_pd)
+    num_species = df["species_common_name"].n_unique()
+    num_endpoints = df.height
     
     # Create title
     title = f"EC10eq Distribution by Trophic Group and Species"
@@ -260,9 +166,8 @@ def create_ec10eq_plot(
     # Calculate powers of 10 for y-axis ticks (only show 1, 10, 100, 1000, etc.)
     yaxis_tickvals = None
     if log_scale:
-        import numpy as np
-        min_val = df_pd["EC10eq"].min()
-        max_val = df_pd["EC10eq"].max()
+        min_val = df["EC10eq"].min()
+        max_val = df["EC10eq"].max()
         # Calculate the range of powers of 10
         min_power = int(np.floor(np.log10(max(min_val, 1e-10))))  # Avoid log(0)
         max_power = int(np.ceil(np.log10(max_val)))
@@ -328,12 +233,11 @@ def main():
     try:
         # Load and prepare data
         print(f"Loading data for CAS: {cas_number}...")
-        df = load_and_prepare_data(file_path, cas_number)
+        df = load_and_prepare_data(cas_number, file_path)
         
         # Get chemical name if available
-        chemical_name = None
-        if "chemical_name" in df.columns:
-            chemical_name = df["chemical_name"][0]
+        chemical_name = df.get_column("chemical_name").first() if "chemical_name" in df.columns else None
+        if chemical_name is not None:
             print(f"Chemical: {chemical_name}")
         
         # Print summary statistics
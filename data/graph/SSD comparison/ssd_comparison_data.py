@@ -58,18 +58,14 @@ def get_ssd_comparison_data(
     Raises:
         ValueError: If any CAS number is not found in the dataframe
     """
-    from data.graph.SSD.plot_ssd_curve import get_ssd_data
+    from data.graph.SSD.plot_ssd_curve import CASNotFoundError, get_ssd_data_batch
     
-    # Validate all CAS exist in database
-    for cas in cas_list:
-        if cas not in dataframe['cas_number'].values:
-            raise ValueError(f"CAS {cas} not found in database.")
-    
-    # Get SSD data for each CAS
-    comparison_data = []
-    for cas in cas_list:
-        ssd_data = get_ssd_data(dataframe, cas)
-        comparison_data.append(ssd_data)
+    # Get SSD data for all CAS: a single pass over the CAS column selects the
+    # rows and reports the missing CAS, the curves are computed in one call
+    try:
+        comparison_data = get_ssd_data_batch(dataframe, cas_list)
+    except CASNotFoundError as e:
+        raise ValueError(f"CAS {e.missing[0]} not found in database.") from None
     
     return {
         "comparison": comparison_data
@@ -9,60 +9,121 @@ Takes as input:
 
 import pandas as pd
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 import plotly.graph_objects as go
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
+# Number of points of the SSD curves
+N_CURVE_POINTS = 400
 
-def get_ssd_data(
-    dataframe: pd.DataFrame,
-    cas: str
-) -> Dict[str, Any]:
+
+class CASNotFoundError(ValueError):
     """
-    Extract SSD (Species Sensitivity Distribution) data for a given CAS number.
+    Raised when CAS numbers are not found in the SSD dataframe.
+    
+    Attributes:
+        missing: CAS numbers not found, in the order they were requested
+    """
+    
+    def __init__(self, missing: List[str]):
+        self.missing = missing
+        super().__init__(f"CAS {missing[0]} not found in dataframe.")
+
+
+def _to_float(value: Any) -> float:
+    """Convert a value to float, returning NaN if it cannot be converted."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def _to_float_array(values: List[Any]) -> np.ndarray:
+    """
+    Convert a list of values to a float64 array in a single NumPy call.
+    
+    None and values that cannot be converted to float become NaN. The slower
+    per-value conversion is only used when NumPy rejects the list (e.g. a
+    non-numeric string).
     
     Args:
-        dataframe: DataFrame containing SSD data
-        cas: CAS number (e.g., "107-05-1")
+        values: List of values (floats, ints, numeric strings, None...)
         
     Returns:
-        Dictionary containing SSD data in JSON format:
-        {
-            "cas_number": str,
-            "chemical_name": str,
-            "ssd_parameters": {
-                "mu_logEC10eq": float,
-                "sigma_logEC10eq": float,
-                "hc20_mgL": float
-            },
-            "summary": {
-                "n_species": int,
-                "n_ecotox_group": int
-            },
-            "species_data": [
-                {
-                    "species_name": str,
-                    "ec10eq_mgL": float,
-                    "trophic_group": str
-                }
-            ],
-            "ssd_curve": {
-                "concentrations_mgL": [float],
-                "affected_species_percent": [float]
-            } or None,
-            "message": str (optional, only present when sigma_ssd == 0)
-        }
-        
-    Raises:
-        ValueError: If CAS not found or invalid data
+        1-D float64 array with one entry per value
     """
-    # Filter by CAS
-    row = dataframe[dataframe['cas_number'] == cas]
-    if len(row) == 0:
-        raise ValueError(f"CAS {cas} not found in dataframe.")
+    try:
+        array = np.asarray(values, dtype=np.float64)
+        if array.ndim == 1:
+            return array
+    except (ValueError, TypeError):
+        pass
+    return np.array([_to_float(value) for value in values], dtype=np.float64)
+
+
+def _extract_species(species_dict_list: List[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract the species of a species_ec10eq_dict_list, sorted by EC10eq.
     
-    row = row.iloc[0]
+    Both the old (species_common_name, EC10eq_species_mean,
+    ecotox_group_unepsetacjrc2018) and the new (species_name, ec10eq,
+    trophic_group) keys are handled. Entries that are not dicts are skipped.
+    
+    Args:
+        species_dict_list: List of species dicts
+        
+    Returns:
+        Tuple of parallel arrays sorted by EC10eq (stable):
+        - Species names (object array of str)
+        - EC10eq values in mg/L (float64, 0.0 for missing/invalid values)
+        - Trophic groups (object array of str)
+    """
+    species_items = [item for item in species_dict_list if isinstance(item, dict)]
+    names = np.array([
+        str(name) if name else 'Unknown'
+        for name in (
+            item.get('species_name') or item.get('species_common_name', 'Unknown')
+            for item in species_items
+        )
+    ], dtype=object)
+    trophic = np.array([
+        str(trophic_group) if trophic_group else 'unknown'
+        for trophic_group in (
+            item.get('trophic_group') or item.get('ecotox_group_unepsetacjrc2018', 'unknown')
+            for item in species_items
+        )
+    ], dtype=object)
+    
+    # Convert EC10eq values in one pass: None, NaN, unconvertible and
+    # non-positive values become 0.0
+    ec10eq = _to_float_array([
+        item.get('ec10eq') or item.get('EC10eq_species_mean', 0)
+        for item in species_items
+    ])
+    ec10eq = np.where(ec10eq > 0, ec10eq, 0.0)
+    
+    # Sort species by EC10eq (stable, as list.sort)
+    order = np.argsort(ec10eq, kind='stable')
+    return names[order], ec10eq[order], trophic[order]
+
+
+def _get_ssd_data_from_row(
+    row: pd.Series,
+    cas: str
+) -> Tuple[Dict[str, Any], Optional[Tuple[float, float, float, float]]]:
+    """
+    Extract the SSD data of a chemical from its row, except the curve points.
     
+    Args:
+        row: Row of the SSD DataFrame for this CAS number
+        cas: CAS number (e.g., "107-05-1")
+        
+    Returns:
+        Tuple of:
+        - SSD data in the format of get_ssd_data, with "ssd_curve" set to None
+        - Curve parameters (mu, sigma, log_min, log_max) in log10 space, or
+          None when no curve can be computed (sigma_ssd == 0)
+    """
     # Extract SSD parameters with safe conversion handling NaN/None values
     # Use .get() with default values to handle missing columns gracefully
     try:
@@ -109,44 +170,22 @@ def get_ssd_data(
     elif not isinstance(species_dict_list, list):
         species_dict_list = []
     
-    # Extract and organize species data
-    species_data = []
-    for item in species_dict_list:
-        if isinstance(item, dict):
-            # Handle both old and new data structure
-            species_name = item.get('species_name') or item.get('species_common_name', 'Unknown')
-            ec10eq = item.get('ec10eq') or item.get('EC10eq_species_mean', 0)
-            trophic_group = item.get('trophic_group') or item.get('ecotox_group_unepsetacjrc2018', 'unknown')
-            
-            # Safe conversion of ec10eq to float, handling None/NaN
-            try:
-                if ec10eq is None:
-                    ec10eq_float = 0.0
-                elif isinstance(ec10eq, float) and np.isnan(ec10eq):
-                    ec10eq_float = 0.0
-                else:
-                    ec10eq_float = float(ec10eq)
-                    if np.isnan(ec10eq_float) or ec10eq_float <= 0:
-                        ec10eq_float = 0.0
-            except (ValueError, TypeError):
-                ec10eq_float = 0.0
-            
-            species_data.append({
-                'species_name': str(species_name) if species_name else 'Unknown',
-                'ec10eq_mgL': ec10eq_float,
-                'trophic_group': str(trophic_group) if trophic_group else 'unknown'
-            })
-    
-    # Sort species data by EC10eq
-    species_data.sort(key=lambda x: x['ec10eq_mgL'])
+    # Extract and organize species data (sorted by EC10eq)
+    names, ec10eq, trophic = _extract_species(species_dict_list)
+    species_data = [
+        {
+            'species_name': name,
+            'ec10eq_mgL': ec10eq_value,
+            'trophic_group': trophic_group
+        }
+        for name, ec10eq_value, trophic_group in zip(names.tolist(), ec10eq.tolist(), trophic.tolist())
+    ]
     
     # Validate parameters and calculate curve
     if sigma_ssd == 0:
         # Single species case - return data without curve
         # Get the species name from species_data if available
-        species_name = "Unknown"
-        if species_data and len(species_data) > 0:
-            species_name = species_data[0].get('species_name', 'Unknown')
+        species_name = species_data[0]['species_name'] if species_data else "Unknown"
         
         message = (
             f"This substance [{chemical_name}] with CAS [{cas}] has only one EC10eq value specific to the species [{species_name}]. "
@@ -168,29 +207,22 @@ def get_ssd_data(
             "species_data": species_data,
             "ssd_curve": None,
             "message": message
-        }
+        }, None
     
     # Calculate SSD curve (CDF in log10 space)
     # All values are in mg/L (milligrams per liter) for consistency
     # Range: extend beyond data range
-    # Filter out NaN/None values from ec10eq_list
-    valid_ec10eq_list = []
-    for x in ec10eq_list:
-        try:
-            if x is not None:
-                x_float = float(x)
-                if not np.isnan(x_float) and x_float > 0:
-                    valid_ec10eq_list.append(x_float)
-        except (ValueError, TypeError):
-            continue
-    
-    if len(valid_ec10eq_list) == 0:
+    # Filter out NaN/None (and non-positive) values from ec10eq_list
+    ec10eq_values = _to_float_array(ec10eq_list)
+    valid_ec10eq = ec10eq_values[ec10eq_values > 0]
+    
+    if valid_ec10eq.size == 0:
         # No valid EC10eq values, use defaults
         ec10_min = 1e-3  # mg/L
         ec10_max = 1e3  # mg/L
     else:
-        ec10_min = min(valid_ec10eq_list)  # mg/L
-        ec10_max = max(valid_ec10eq_list)  # mg/L
+        ec10_min = float(valid_ec10eq.min())  # mg/L
+        ec10_max = float(valid_ec10eq.max())  # mg/L
     
     # Ensure positive values for log10
     ec10_min = max(ec10_min, 1e-6)  # Avoid log10(0) or negative
@@ -207,16 +239,7 @@ def get_ssd_data(
     if log_hc20 > log_max:
         log_max = log_hc20 + 0.5
     
-    # Generate x values in log10 space, then convert to mg/L
-    n_points = 400
-    x_log = np.linspace(log_min, log_max, n_points)
-    x_real = 10 ** x_log  # Convert to real units: mg/L (milligrams per liter)
-    
-    # Calculate CDF (cumulative distribution function)
-    # This represents the percentage of species affected at each concentration
-    cdf = 100 * norm.cdf(x_log, loc=mu_ssd, scale=sigma_ssd)
-    
-    # Build response
+    # The curve itself is computed by _ssd_curves (for all CAS at once)
     return {
         "cas_number": cas,
         "chemical_name": chemical_name,
@@ -230,11 +253,137 @@ def get_ssd_data(
             "n_ecotox_group": n_ecotox_group
         },
         "species_data": species_data,
-        "ssd_curve": {
-            "concentrations_mgL": [float(x) for x in x_real],
-            "affected_species_percent": [float(y) for y in cdf]
+        "ssd_curve": None
+    }, (mu_ssd, sigma_ssd, log_min, log_max)
+
+
+def _ssd_curves(
+    mu: np.ndarray,
+    sigma: np.ndarray,
+    log_min: np.ndarray,
+    log_max: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the SSD curves of K chemicals at once.
+    
+    Args:
+        mu: Means in log10 space, shape (K,)
+        sigma: Standard deviations in log10 space, shape (K,)
+        log_min: Lower bounds of the curves in log10 space, shape (K,)
+        log_max: Upper bounds of the curves in log10 space, shape (K,)
+        
+    Returns:
+        Tuple (concentrations in mg/L, percentages of affected species),
+        both of shape (K, N_CURVE_POINTS)
+    """
+    # Generate x values in log10 space, then convert to mg/L
+    x_log = np.linspace(log_min, log_max, N_CURVE_POINTS, axis=-1)
+    x_real = 10 ** x_log  # Convert to real units: mg/L (milligrams per liter)
+    
+    # Calculate CDF (cumulative distribution function)
+    # This represents the percentage of species affected at each concentration
+    # (ndtr is the standard normal CDF ufunc behind norm.cdf, called directly)
+    cdf = 100 * ndtr((x_log - mu[:, None]) / sigma[:, None])
+    return x_real, cdf
+
+
+def get_ssd_data_batch(
+    dataframe: pd.DataFrame,
+    cas_list: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Extract SSD data for several CAS numbers, computing all curves in one pass.
+    
+    The rows of all CAS numbers are selected with a single filter and the
+    curves are evaluated together as a (K, N_CURVE_POINTS) array.
+    
+    Args:
+        dataframe: DataFrame containing SSD data
+        cas_list: CAS numbers (e.g., ["107-05-1", "50-00-0"])
+        
+    Returns:
+        List of SSD data dictionaries (see get_ssd_data), in the order of cas_list
+        
+    Raises:
+        CASNotFoundError: If CAS numbers are not found (all of them are reported)
+        ValueError: If invalid data
+    """
+    matches = dataframe[dataframe['cas_number'].isin(cas_list)]
+    
+    # Position of the first row of each CAS number in matches
+    first_rows = {}
+    for position, cas in enumerate(matches['cas_number'].tolist()):
+        first_rows.setdefault(cas, position)
+    
+    missing = [cas for cas in cas_list if cas not in first_rows]
+    if missing:
+        raise CASNotFoundError(missing)
+    
+    results = []
+    curve_indexes = []
+    curve_parameters = []
+    for cas in cas_list:
+        ssd_data, parameters = _get_ssd_data_from_row(matches.iloc[first_rows[cas]], cas)
+        if parameters is not None:
+            curve_indexes.append(len(results))
+            curve_parameters.append(parameters)
+        results.append(ssd_data)
+    
+    if curve_parameters:
+        mu, sigma, log_min, log_max = np.array(curve_parameters, dtype=np.float64).T
+        x_real, cdf = _ssd_curves(mu, sigma, log_min, log_max)
+        for index, concentrations, affected in zip(curve_indexes, x_real.tolist(), cdf.tolist()):
+            results[index]["ssd_curve"] = {
+                "concentrations_mgL": concentrations,
+                "affected_species_percent": affected
+            }
+    
+    return results
+
+
+def get_ssd_data(
+    dataframe: pd.DataFrame,
+    cas: str
+) -> Dict[str, Any]:
+    """
+    Extract SSD (Species Sensitivity Distribution) data for a given CAS number.
+    
+    Args:
+        dataframe: DataFrame containing SSD data
+        cas: CAS number (e.g., "107-05-1")
+        
+    Returns:
+        Dictionary containing SSD data in JSON format:
+        {
+            "cas_number": str,
+            "chemical_name": str,
+            "ssd_parameters": {
+                "mu_logEC10eq": float,
+                "sigma_logEC10eq": float,
+                "hc20_mgL": float
+            },
+            "summary": {
+                "n_species": int,
+                "n_ecotox_group": int
+            },
+            "species_data": [
+                {
+                    "species_name": str,
+                    "ec10eq_mgL": float,
+                    "trophic_group": str
+                }
+            ],
+            "ssd_curve": {
+                "concentrations_mgL": [float],
+                "affected_species_percent": [float]
+            } or None,
+            "message": str (optional, only present when sigma_ssd == 0)
         }
-    }
+        
+    Raises:
+        ValueError: If CAS not found or invalid data
+    """
+    return get_ssd_data_batch(dataframe, [cas])[0]
 
 
 def plot_ssd_curve(
@@ -310,7 +459,8 @@ def plot_ssd_curve(
     
     # Calculate CDF (cumulative distribution function)
     # This represents the percentage of species affected at each concentration
-    cdf = 100 * norm.cdf(x_log, loc=mu_ssd, scale=sigma_ssd)
+    # (ndtr is the standard normal CDF ufunc behind norm.cdf, called directly)
+    cdf = 100 * ndtr((x_log - mu_ssd) / sigma_ssd)
     
     # Create figure
     fig = go.Figure()
@@ -326,27 +476,13 @@ def plot_ssd_curve(
     ))
     
     # Add species points grouped by trophic_group
-    # Extract and organize species data by trophic group
-    species_data = []
-    for item in species_dict_list:
-        if isinstance(item, dict):
-            # Handle both old and new data structure
-            species_name = item.get('species_name') or item.get('species_common_name', 'Unknown')
-            ec10eq = item.get('ec10eq') or item.get('EC10eq_species_mean', 0)
-            trophic_group = item.get('trophic_group') or item.get('ecotox_group_unepsetacjrc2018', 'unknown')
-            
-            species_data.append({
-                'name': species_name,
-                'ec10eq': ec10eq,
-                'trophic_group': trophic_group
-            })
-    
-    if species_data:
-        species_data.sort(key=lambda x: x['ec10eq'])
-        n_species_points = len(species_data)
+    names, ec10eq, trophic = _extract_species(species_dict_list)
+    
+    if len(ec10eq) > 0:
+        n_species_points = len(ec10eq)
         
         # Calculate y positions (percentile ranks)
-        y_positions = [(i + 0.5) / n_species_points * 100 for i in range(n_species_points)]
+        y_positions = (np.arange(n_species_points) + 0.5) / n_species_points * 100
         
         # Define colors and symbols for different trophic groups
         # Based on JRC Ecotox EF3.1 standard groups
@@ -361,27 +497,17 @@ def plot_ssd_curve(
             'annelids': {'color': '#bcbd22', 'symbol': 'hourglass'},  # Yellow-green
         }
         
-        # Group species by trophic_group
-        trophic_groups = {}
-        for i, item in enumerate(species_data):
-            tg = item['trophic_group']
-            if tg not in trophic_groups:
-                trophic_groups[tg] = {
-                    'x': [],
-                    'y': [],
-                    'names': []
-                }
-            trophic_groups[tg]['x'].append(item['ec10eq'])
-            trophic_groups[tg]['y'].append(y_positions[i])
-            trophic_groups[tg]['names'].append(item['name'])
+        # Trophic groups in order of first appearance (lowest EC10eq first)
+        _, first_index = np.unique(trophic, return_index=True)
         
-        # Add a trace for each trophic group
-        for trophic_group, data in trophic_groups.items():
+        # Add a trace for each trophic group (boolean mask over the sorted species)
+        for trophic_group in trophic[np.sort(first_index)].tolist():
+            mask = trophic == trophic_group
             style = trophic_group_styles.get(trophic_group, {'color': '#d62728', 'symbol': 'circle'})
             
             fig.add_trace(go.Scatter(
-                x=data['x'],
-                y=data['y'],
+                x=ec10eq[mask],
+                y=y_positions[mask],
                 mode='markers',
                 name=trophic_group.capitalize(),
                 marker=dict(
@@ -390,7 +516,7 @@ def plot_ssd_curve(
                     symbol=style['symbol'],
                     line=dict(width=1, color='black')
                 ),
-                text=data['names'],
+                text=names[mask],
                 hovertemplate=(
                     '<b>%{text}</b><br>'
                     'Trophic group: ' + trophic_group + '<br>'
@@ -50,7 +50,7 @@ if "%HTTP_CODE%"=="200" (
     echo Pour démarrer le serveur:
     echo    scripts\start_local.bat %PORT%
     echo    ou
-    echo    uvicorn app.main:app --host 0.0.0.0 --port %PORT% --reload
+    echo    uvicorn app.main:app --host 0.0.0.0 --port %PORT% --reload --no-server-header
     pause
     exit /b 1
 )
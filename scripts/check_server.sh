@@ -40,7 +40,7 @@ else
     echo "Pour démarrer le serveur:"
     echo "   ./scripts/start_local.sh $PORT"
     echo "   ou"
-    echo "   uvicorn app.main:app --host 0.0.0.0 --port $PORT --reload"
+    echo "   uvicorn app.main:app --host 0.0.0.0 --port $PORT --reload --no-server-header"
     exit 1
 fi
 
@@ -89,7 +89,7 @@ if %ERRORLEVEL% EQU 0 (
     echo ✅ Procfile contains correct uvicorn command
 ) else (
     echo ❌ Procfile may be incorrect
-    echo ℹ️  Expected: web: uvicorn app.main:app --host 0.0.0.0 --port $PORT
+    echo ℹ️  Expected: web: uvicorn app.main:app --host 0.0.0.0 --port $PORT --no-server-header --proxy-headers --forwarded-allow-ips "${FORWARDED_ALLOW_IPS:-127.0.0.1}"
     set /a FAILED_CHECKS+=1
 )
 echo.
@@ -136,7 +136,7 @@ if grep -q "uvicorn app.main:app" Procfile; then
     print_success "Procfile contains correct uvicorn command"
 else
     print_error "Procfile may be incorrect"
-    print_info "Expected: web: uvicorn app.main:app --host 0.0.0.0 --port \$PORT"
+    print_info "Expected: web: uvicorn app.main:app --host 0.0.0.0 --port \$PORT --no-server-header --proxy-headers --forwarded-allow-ips \"\${FORWARDED_ALLOW_IPS:-127.0.0.1}\""
 fi
 echo ""
 
@@ -69,5 +69,5 @@ echo Appuyez sur Ctrl+C pour arrêter le serveur.
 echo.
 
 REM Démarrer le serveur avec rechargement automatique
-uvicorn app.main:app --host 0.0.0.0 --port %PORT% --reload
+uvicorn app.main:app --host 0.0.0.0 --port %PORT% --reload --no-server-header
 
@@ -96,5 +96,5 @@ echo "Appuyez sur Ctrl+C pour arrêter le serveur."
 echo ""
 
 # Démarrer le serveur avec rechargement automatique
-uvicorn app.main:app --host 0.0.0.0 --port $PORT --reload --log-level info
+uvicorn app.main:app --host 0.0.0.0 --port $PORT --reload --log-level info --no-server-header
 
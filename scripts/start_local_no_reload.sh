@@ -67,5 +67,5 @@ echo "Appuyez sur Ctrl+C pour arrêter le serveur."
 echo ""
 
 # Démarrer le serveur SANS rechargement automatique
-uvicorn app.main:app --host 0.0.0.0 --port $PORT --log-level debug
+uvicorn app.main:app --host 0.0.0.0 --port $PORT --log-level debug --no-server-header
 
@@ -16,6 +16,25 @@ def test_health_check(client):
     assert "data" in data
 
 
+def test_health_check_caches_data_errors(client, monkeypatch):
+    """Test that a data loading error is reported and not re-checked on every probe."""
+    import app.main as main
+    
+    calls = []
+    
+    def failing_row_count():
+        calls.append(1)
+        raise FileNotFoundError("missing")
+    
+    monkeypatch.setattr(main, "load_data_row_count", failing_row_count)
+    monkeypatch.setattr(main, "_health_cache", None)
+    for _ in range(2):
+        data = client.get("/health").json()
+        assert data["status"] == "ok"
+        assert data["data"] == {"status": "error: missing", "rows": 0}
+    assert len(calls) == 1
+
+
 def test_root_endpoint(client):
     """Test that the root endpoint returns API information."""
     response = client.get("/")
@@ -26,6 +45,14 @@ def test_root_endpoint(client):
     assert "endpoints" in data
 
 
+def test_root_endpoint_not_modified(client):
+    """Test that the root endpoint answers 304 when the client has the same ETag."""
+    etag = client.get("/").headers["etag"]
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+
 def test_get_summary(client):
     """Test that the summary endpoint returns data statistics."""
     response = client.get("/api/summary")
@@ -181,3 +208,85 @@ def test_ssd_comparison_too_many_substances(client, sample_cas):
     response = client.post("/api/plot/ssd/comparison", json=payload)
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+
+def test_ssd_comparison_resolves_names_and_cas(client):
+    """Test that identifiers are resolved by CAS number or name in one request."""
+    payload = {
+        "cas_list": ["50-00-0", "Formaldehyde", "not-a-substance-zzz"]
+    }
+    response = client.post("/api/plot/ssd/comparison", json=payload)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    detail = response.json()["detail"]
+    assert "'not-a-substance-zzz'" in detail
+    assert "Formaldehyde" not in detail
+
+
+def test_resolve_cas_identifiers_is_cached(monkeypatch):
+    """Test that a resolved identifier is not matched against the names again."""
+    import app.api as api
+    
+    calls = []
+    load_chemical_names_lower = api.load_chemical_names_lower
+    
+    def counting_load():
+        calls.append(True)
+        return load_chemical_names_lower()
+    
+    monkeypatch.setattr(api, "load_chemical_names_lower", counting_load)
+    monkeypatch.setattr(api, "_resolved_cas", api.LRUCache(api.RESOLVED_CAS_CACHE_SIZE))
+    first = api.resolve_cas_identifiers(["Formaldehyde"])
+    second = api.resolve_cas_identifiers(["  Formaldehyde "])
+    assert first == second == (["50-00-0"], [])
+    assert len(calls) == 1
+
+
+def test_search_with_regex_characters(client):
+    """Test that regex metacharacters in the query are matched literally."""
+    response = client.get("/api/search?query=benz(a")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["query"] == "benz(a"
+    assert isinstance(data["matches"], list)
+
+
+def test_search_with_non_canonical_cas(client):
+    """Test that CAS numbers are matched on their canonical form."""
+    response = client.get("/api/search?query= 50-0-0 ")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["count"] == 1
+    assert data["matches"][0]["cas"] == "50-00-0"
+
+
+def test_rate_limit_key_ignores_forwarded_for():
+    """Test that a client cannot choose its rate limit key with X-Forwarded-For."""
+    from starlette.requests import Request
+    from app.security import get_rate_limit_key
+    
+    scope = {
+        "type": "http",
+        "headers": [(b"x-forwarded-for", b"203.0.113.7")],
+        "client": ("10.0.0.1", 12345),
+    }
+    assert get_rate_limit_key(Request(scope)) == "10.0.0.1"
+
+
+def test_rate_limit_key_ignores_forged_forwarded_for_behind_proxy():
+    """Test that a forged X-Forwarded-For value is ignored after uvicorn's proxy handling."""
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+    from starlette.testclient import TestClient
+    from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+    from app.security import get_rate_limit_key
+    
+    def rate_limit_key(request):
+        return PlainTextResponse(get_rate_limit_key(request))
+    
+    app = Starlette(routes=[Route("/", rate_limit_key)])
+    # Requests reach the application through the trusted router at 10.0.0.1
+    proxied = TestClient(ProxyHeadersMiddleware(app, trusted_hosts="10.0.0.1"), client=("10.0.0.1", 50000))
+    for forged in ("198.51.100.1", "198.51.100.2"):
+        # The router appends the address of the client it received the request from
+        response = proxied.get("/", headers={"X-Forwarded-For": f"{forged}, 203.0.113.7"})
+        assert response.text == "203.0.113.7"
@@ -0,0 +1,78 @@
+"""
+Tests for the response cache.
+"""
+from app.cache import cache_response
+
+
+def test_cache_response_reuses_result():
+    """Test that repeated calls with the same arguments hit the cache."""
+    calls = []
+
+    @cache_response()
+    def endpoint(cas: str):
+        calls.append(cas)
+        return {"cas": cas}
+
+    first = endpoint(cas="50-00-0")
+    second = endpoint(cas="50-00-0")
+    assert first is second
+    assert calls == ["50-00-0"]
+
+    endpoint(cas="107-05-1")
+    assert calls == ["50-00-0", "107-05-1"]
+
+
+def test_cache_response_evicts_least_recently_used():
+    """Test that the cache never holds more than maxsize entries."""
+    calls = []
+
+    @cache_response(maxsize=2)
+    def endpoint(cas: str):
+        calls.append(cas)
+        return cas
+
+    endpoint(cas="a")
+    endpoint(cas="b")
+    endpoint(cas="a")
+    endpoint(cas="c")  # evicts "b"
+    endpoint(cas="a")
+    endpoint(cas="b")
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_cache_response_does_not_cache_errors():
+    """Test that exceptions are raised again instead of being cached."""
+    calls = []
+
+    @cache_response()
+    def endpoint(cas: str):
+        calls.append(cas)
+        raise ValueError(cas)
+
+    for _ in range(2):
+        try:
+            endpoint(cas="999-99-9")
+        except ValueError:
+            pass
+    assert len(calls) == 2
+
+
+def test_cache_response_expires_after_ttl(monkeypatch):
+    """Test that cached responses are recomputed once their TTL has elapsed."""
+    calls = []
+    clock = [100.0]
+    monkeypatch.setattr("app.cache.time.monotonic", lambda: clock[0])
+
+    @cache_response(ttl=60)
+    def endpoint(cas: str):
+        calls.append(cas)
+        return cas
+
+    endpoint(cas="50-00-0")
+    clock[0] += 30
+    endpoint(cas="50-00-0")
+    assert calls == ["50-00-0"]
+
+    clock[0] += 31
+    endpoint(cas="50-00-0")
+    assert calls == ["50-00-0", "50-00-0"]